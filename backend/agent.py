@@ -1,13 +1,16 @@
 import json
 import logging
 import asyncio
-from typing import Any, Literal
+from typing import Any, AsyncIterator
 
+import msgspec
+import orjson
 from dotenv import load_dotenv
 from livekit import rtc
 from livekit.agents import (
     AutoSubscribe,
     JobContext,
+    JobProcess,
     WorkerOptions,
     cli,
     llm,
@@ -15,13 +18,15 @@ from livekit.agents import (
     function_tool,
     RunContext,
 )
+from livekit.agents import vad as agents_vad
 from livekit.agents.voice import Agent, AgentSession
 from livekit.plugins import google, noise_cancellation, silero
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
-from pydantic import BaseModel, ValidationError
 
 
 # Import local services
+from app.voice.gated_vad import GatedVAD
+from app.voice.greetings import NARRATOR_VOICES, greeting_text, load_greeting_frames
 from app.voice.prompt import SYSTEM_PROMPT
 
 load_dotenv()
@@ -29,13 +34,52 @@ load_dotenv()
 logger = logging.getLogger("sagevox-agent")
 
 
-class ContextUpdateMessage(BaseModel):
-    """Schema for context update messages from the client."""
+class ContextUpdateMessage(msgspec.Struct, tag="context_update"):
+    """Schema for context update messages from the client ({"type": "context_update", ...})."""
 
-    type: Literal["context_update"]
     context: dict[str, Any]
 
 
+# Built once so every data packet is decoded and validated in a single pass
+_CONTEXT_DECODER = msgspec.json.Decoder(ContextUpdateMessage)
+
+# Noise-cancellation descriptors are stateless, so build them once per worker
+_NC_BVC = noise_cancellation.BVC()
+_NC_BVC_TELEPHONY = noise_cancellation.BVCTelephony()
+
+# Silero VAD model shared by every session in this worker process
+_VAD_MODEL: agents_vad.VAD | None = None
+
+
+def _get_vad() -> agents_vad.VAD:
+    """Load the Silero VAD model once per process and reuse it.
+
+    The model is wrapped in an energy gate so near-silent frames skip inference.
+    """
+    global _VAD_MODEL
+    if _VAD_MODEL is None:
+        _VAD_MODEL = GatedVAD(silero.VAD.load())
+    return _VAD_MODEL
+
+
+def prewarm(proc: JobProcess) -> None:
+    """Load models before the first job so sessions don't pay for it."""
+    _get_vad()
+
+
+# Pre-encoded payloads for commands that never carry data
+_NO_DATA_COMMAND_PAYLOADS: dict[str, bytes] = {
+    command: orjson.dumps({"command": command, "data": {}})
+    for command in ("resume_playback",)
+}
+
+# Commands queued within this window go out as one data-channel message
+_COMMAND_BATCH_WINDOW_SECONDS = 0.01
+_COMMAND_BATCH_MAX = 8
+# How long on_exit waits for queued commands to go out
+_COMMAND_DRAIN_TIMEOUT_SECONDS = 2.0
+
+
 class SageVoxAgent(Agent):
     """Custom agent with tools for patient conversations and playback control."""
 
@@ -45,6 +89,20 @@ class SageVoxAgent(Agent):
         self.room = room
         # Store dynamic context received from iOS - updated per interaction
         self.current_context: dict[str, Any] = {}
+        # Outbound commands, batched by _flush_commands; each carries the
+        # future its sender awaits for the publish result
+        self._cmd_queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[None]]] = (
+            asyncio.Queue()
+        )
+        self._flush_task: asyncio.Task | None = None
+
+    async def on_exit(self) -> None:
+        # Deliver whatever is still queued before the session goes away
+        if self._flush_task and not self._flush_task.done():
+            try:
+                await asyncio.wait_for(self._flush_task, _COMMAND_DRAIN_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out flushing queued commands on exit")
 
     def update_context(self, context: dict):
         """Update the current context from iOS client."""
@@ -55,11 +113,72 @@ class SageVoxAgent(Agent):
         )
 
     async def _send_command(self, command: str, data: dict[str, Any] | None = None) -> None:
-        """Send a command to the iOS client via data channel."""
-        if self.room and self.room.local_participant:
-            payload = json.dumps({"command": command, "data": data or {}}).encode()
+        """Send a command to the iOS client via data channel.
+
+        Commands issued in the same turn are coalesced into a single
+        {"commands": [...]} message; a lone command keeps the plain shape.
+        Publish failures are raised to the caller either way.
+        """
+        if not (self.room and self.room.local_participant):
+            return
+
+        idle = (self._flush_task is None or self._flush_task.done()) and self._cmd_queue.empty()
+        payload = None if data else _NO_DATA_COMMAND_PAYLOADS.get(command)
+        if payload is not None and idle:
+            # Latency-critical solo commands skip the batching window
             await self.room.local_participant.publish_data(payload, reliable=True)
             logger.info(f"Sent command to client: {command}")
+            return
+
+        sent = asyncio.get_running_loop().create_future()
+        await self._cmd_queue.put(({"command": command, "data": data or {}}, sent))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_commands())
+        await sent
+
+    async def _flush_commands(self) -> None:
+        """Publish queued commands in order, batching those that arrive within a short window.
+
+        Returns once the queue is empty; _send_command starts a new flush as needed.
+        """
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[dict[str, Any], asyncio.Future[None]]] = []
+        try:
+            while not self._cmd_queue.empty():
+                batch = [self._cmd_queue.get_nowait()]
+                deadline = loop.time() + _COMMAND_BATCH_WINDOW_SECONDS
+                while len(batch) < _COMMAND_BATCH_MAX:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._cmd_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                commands = [command for command, _ in batch]
+                payload = orjson.dumps(
+                    commands[0] if len(commands) == 1 else {"commands": commands}
+                )
+                try:
+                    await self.room.local_participant.publish_data(payload, reliable=True)
+                except Exception as e:
+                    logger.error(f"Failed to send commands to client: {e}")
+                    for _, sent in batch:
+                        if not sent.done():
+                            sent.set_exception(e)
+                    continue
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_result(None)
+                logger.info(f"Sent command(s) to client: {[c['command'] for c in commands]}")
+        except asyncio.CancelledError:
+            # Don't leave senders waiting on commands that will never go out
+            while not self._cmd_queue.empty():
+                batch.append(self._cmd_queue.get_nowait())
+            for _, sent in batch:
+                sent.cancel()
+            raise
 
     @function_tool()
     async def get_current_context(self, context: RunContext) -> str:
@@ -99,7 +218,12 @@ Current text context:
         Trigger words: 'stop', 'that's all', 'thanks', 'bye', 'continue reading', 'go back to the book', 'resume', 'I'm done'
         """
         logger.info("stop_and_resume_book tool called")
-        await asyncio.sleep(0.5)
+        # Let any speech already queued for this turn finish, but never hold
+        # playback back for more than half a second
+        try:
+            await asyncio.wait_for(context.wait_for_playout(), timeout=0.5)
+        except asyncio.TimeoutError:
+            pass
         await self._send_command("resume_playback")
         return ""
 
@@ -140,6 +264,11 @@ Current text context:
         return f"Jumping to chapter {chapter_number}."
 
 
+async def _iter_frames(frames: list[rtc.AudioFrame]) -> AsyncIterator[rtc.AudioFrame]:
+    for frame in frames:
+        yield frame
+
+
 async def entrypoint(ctx: JobContext):
     """Main agent logic entrypoint."""
     logger.info(f"connecting to room {ctx.room.name}")
@@ -161,7 +290,7 @@ async def entrypoint(ctx: JobContext):
                 raise ValueError("Metadata must be a JSON object")
             book_title = str(meta_dict.get("book_title", ""))
             narrator_voice = str(meta_dict.get("narrator_voice", "Kore"))
-            if narrator_voice not in ["Puck", "Charon", "Kore", "Fenrir", "Aoede"]:
+            if narrator_voice not in NARRATOR_VOICES:
                 narrator_voice = "Kore"
             logger.info(f"Parsed metadata: book_title={book_title}, voice={narrator_voice}")
         except json.JSONDecodeError as e:
@@ -171,8 +300,8 @@ async def entrypoint(ctx: JobContext):
 
     logger.info(f"Starting voice agent with FIXED system prompt")
 
-    # Load VAD model
-    vad = silero.VAD.load()
+    # Shared VAD model (loaded in prewarm)
+    vad = _get_vad()
 
     # Create agent with FIXED system prompt - NEVER changes!
     agent = SageVoxAgent(
@@ -201,14 +330,13 @@ async def entrypoint(ctx: JobContext):
     @ctx.room.on("data_received")
     def on_data_received(data: rtc.DataPacket):
         try:
-            payload = data.data.decode("utf-8")
-            message = ContextUpdateMessage.model_validate_json(payload)
-        except UnicodeDecodeError as exc:
-            logger.warning(f"Invalid data channel payload encoding: {exc}")
-            return
-        except ValidationError as exc:
+            message = _CONTEXT_DECODER.decode(data.data)
+        except msgspec.ValidationError as exc:
             logger.warning(f"Invalid data channel payload schema: {exc}")
             return
+        except msgspec.DecodeError as exc:
+            logger.warning(f"Invalid data channel payload: {exc}")
+            return
 
         # iOS sent updated context for the current interaction
         agent.update_context(message.context)
@@ -220,25 +348,26 @@ async def entrypoint(ctx: JobContext):
         agent=agent,
         room_options=room_io.RoomOptions(
             audio_input=room_io.AudioInputOptions(
-                noise_cancellation=lambda params: noise_cancellation.BVCTelephony()
+                noise_cancellation=lambda params: _NC_BVC_TELEPHONY
                 if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                else noise_cancellation.BVC(),
+                else _NC_BVC,
             ),
         ),
     )
 
-    # Initial greeting
-    greeting = (
-        f"Hey! I'm SageVox, your companion for {book_title}. What would you like to know?"
-        if book_title
-        else "Hey! I'm SageVox, your audiobook companion. What would you like to know?"
-    )
-    await session.generate_reply(instructions=f"Say exactly: '{greeting}'")
+    # Initial greeting - play the pre-rendered clip when we have one
+    greeting = greeting_text(book_title)
+    greeting_frames = load_greeting_frames(narrator_voice, greeting)
+    if greeting_frames:
+        await session.say(greeting, audio=_iter_frames(greeting_frames))
+    else:
+        await session.generate_reply(instructions=f"Say exactly: '{greeting}'")
 
 
 if __name__ == "__main__":
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
         ),
     )
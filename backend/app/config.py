@@ -2,7 +2,6 @@
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -42,6 +41,7 @@ class Settings(BaseSettings):
 
     # Books storage directory
     books_dir: Path = Path(__file__).parent.parent / "books"
+    library_refresh_seconds: float = 30.0  # How often to check books for changes
 
 
 @lru_cache
@@ -1,5 +1,6 @@
 """SageVox Backend - Main FastAPI application."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -10,6 +11,7 @@ from fastapi.staticfiles import StaticFiles
 
 from .config import get_settings
 from .routers import live, books
+from .services.library import get_library_index, watch_library
 
 settings = get_settings()
 
@@ -35,7 +37,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     routes = [f"{route.methods} {route.path}" for route in app.routes if hasattr(route, 'methods')]
     logger.info(f"Registered routes: {routes}")
 
+    # Build the library index once and keep it fresh in the background
+    library_index = await asyncio.to_thread(get_library_index)
+    refresh_task = asyncio.create_task(
+        watch_library(library_index, settings.library_refresh_seconds)
+    )
+
     yield
+    refresh_task.cancel()
     logger.info("Shutting down SageVox Backend")
 
 
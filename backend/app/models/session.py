@@ -2,10 +2,13 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
 from enum import Enum
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class SessionState(str, Enum):
     """Possible states for a Live API session."""
 
@@ -17,7 +20,7 @@ class SessionState(str, Enum):
     DISCONNECTED = "disconnected"
 
 
-@dataclass
+@dataclass(slots=True)
 class BookContext:
     """Context about the book being listened to."""
 
@@ -27,31 +30,62 @@ class BookContext:
     narrator_voice: str
     current_chapter: int
     total_chapters: int
+    # Change through set_chapter_summary so cached context stays current
     chapter_summaries: dict[int, str] = field(default_factory=dict)
+    # Joined summaries per chapter; entry N depends on summaries 1..N
+    _context_cache: dict[int, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def set_chapter_summary(self, chapter: int, summary: str) -> None:
+        """Set a chapter summary, invalidating cached context from that chapter on."""
+        self.chapter_summaries[chapter] = summary
+        if self._context_cache:
+            for stale in [ch for ch in self._context_cache if ch >= chapter]:
+                del self._context_cache[stale]
 
     def get_context_up_to_chapter(self, chapter: int) -> str:
         """Get summaries for chapters up to and including the given chapter."""
-        summaries = []
-        for ch_num in range(1, chapter + 1):
-            if ch_num in self.chapter_summaries:
-                summaries.append(f"Chapter {ch_num}: {self.chapter_summaries[ch_num]}")
-        return "\n".join(summaries) if summaries else "No chapter summaries available."
+        return self._joined_summaries(chapter) or "No chapter summaries available."
+
+    def _joined_summaries(self, chapter: int) -> str:
+        if self._context_cache is None:
+            self._context_cache = {}
+        cached = self._context_cache.get(chapter)
+        if cached is not None:
+            return cached
+
+        # Extend the previous chapter's result when we have it (the common case
+        # as the listener moves forward), otherwise build from scratch
+        prev = self._context_cache.get(chapter - 1)
+        if prev is None:
+            prev = "\n".join(
+                f"Chapter {ch_num}: {self.chapter_summaries[ch_num]}"
+                for ch_num in range(1, chapter)
+                if ch_num in self.chapter_summaries
+            )
+
+        line = ""
+        if chapter >= 1 and chapter in self.chapter_summaries:
+            line = f"Chapter {chapter}: {self.chapter_summaries[chapter]}"
+
+        result = f"{prev}\n{line}" if prev and line else (prev or line)
+        self._context_cache[chapter] = result
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Represents an active Live API session."""
 
     session_id: str
     book_context: BookContext
     state: SessionState = SessionState.CONNECTING
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utcnow)
+    last_activity: datetime = field(default_factory=_utcnow)
     questions_asked: int = 0
 
     def update_activity(self) -> None:
         """Update the last activity timestamp."""
-        self.last_activity = datetime.now(timezone.utc)
+        self.last_activity = _utcnow()
 
     def increment_questions(self) -> None:
         """Increment the questions asked counter."""
@@ -60,5 +94,5 @@ class Session:
 
     def is_expired(self, timeout_seconds: int) -> bool:
         """Check if the session has expired."""
-        elapsed = (datetime.now(timezone.utc) - self.last_activity).total_seconds()
+        elapsed = (_utcnow() - self.last_activity).total_seconds()
         return elapsed > timeout_seconds
@@ -1,32 +1,38 @@
 """Books API router for listing and retrieving audiobook metadata."""
 
 import logging
+import os
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
+from starlette.routing import NoMatchFound
 
+from ..config import get_settings
 from ..services.library import (
     get_books_dir,
-    load_book_metadata,
-    get_book_with_chapters,
+    get_book_json,
+    get_library_index,
 )
 from ..models.book import Book, BookSummary
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/books", tags=["books"])
 
-# Log when this module is imported (helps debug Railway deployment)
-_books_dir = get_books_dir()
-logger.info(f"Books router loaded. Books directory: {_books_dir}, exists: {_books_dir.exists()}")
-
 
 @router.get("/debug")
-async def debug_books() -> dict:
-    """Debug endpoint to check books directory status."""
+def debug_books() -> dict:
+    """Debug endpoint to check books directory status (sync, runs in the threadpool).
+
+    Only available when DEBUG is enabled.
+    """
+    if not get_settings().debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+
     books_dir = get_books_dir()
     contents = []
     if books_dir.exists():
         try:
-            contents = [str(p.name) for p in books_dir.iterdir()]
+            with os.scandir(books_dir) as entries:
+                contents = [entry.name for entry in entries]
         except Exception as e:
             contents = [f"Error listing: {e}"]
     return {
@@ -40,53 +46,32 @@ async def debug_books() -> dict:
 @router.get("", response_model=list[BookSummary])
 async def list_books(request: Request) -> list[BookSummary]:
     """List all available books in the library."""
-    books_dir = get_books_dir()
-    logger.info(f"list_books called. books_dir={books_dir}, exists={books_dir.exists()}")
+    summaries = get_library_index().summaries
+    if not any(s.cover_url for s in summaries):
+        return summaries
 
-    if not books_dir.exists():
-        logger.warning(f"Books directory not found: {books_dir}")
-        return []
-    
-    books: list[BookSummary] = []
-    
-    # Scan for book directories
-    for item in books_dir.iterdir():
-        if not item.is_dir():
-            continue
-        
-        metadata = load_book_metadata(item)
-        if metadata is None:
-            continue
-        
-        # Construct cover URL if cover exists
-        cover_url = None
-        if metadata.cover_image:
-            # Build absolute URL for cover image
-            cover_url = str(request.url_for("books_static", path=f"{metadata.id}/{metadata.cover_image}"))
-        
-        books.append(BookSummary(
-            id=metadata.id,
-            title=metadata.title,
-            author=metadata.author,
-            description=metadata.description,
-            cover_url=cover_url,
-            total_chapters=metadata.total_chapters,
-            total_duration_seconds=metadata.total_duration_seconds,
-        ))
-    
-    # Sort by title
-    books.sort(key=lambda b: b.title)
-    
-    logger.info(f"Found {len(books)} books")
-    return books
+    # Resolve the static route once; each cover is then a plain concatenation
+    try:
+        static_base = str(request.url_for("books_static", path=""))
+    except NoMatchFound:
+        # Books are only mounted if the directory existed at startup
+        static_base = None
+    return [
+        s.model_copy(update={"cover_url": static_base + s.cover_url if static_base else None})
+        if s.cover_url
+        else s
+        for s in summaries
+    ]
 
 
 @router.get("/{book_id}", response_model=Book)
-async def get_book(book_id: str) -> Book:
+async def get_book(book_id: str) -> Response:
     """Get full book metadata with chapters and embedded transcripts."""
-    book = get_book_with_chapters(book_id)
+    # Served from the cached JSON encoding, so large transcripts aren't
+    # re-serialized on every request
+    payload = await get_book_json(book_id)
     
-    if book is None:
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Book not found: {book_id}")
     
-    return book
+    return Response(content=payload, media_type="application/json")
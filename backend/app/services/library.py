@@ -1,22 +1,40 @@
 """Service for loading book data from the file system."""
 
-import json
+import asyncio
 import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
 
 from ..config import get_settings
 from ..models.book import (
     Book,
     BookMetadata,
+    BookSummary,
     Chapter,
+    ChapterMetadata,
     Transcript,
 )
 
 logger = logging.getLogger(__name__)
 
+# Optional per-book file holding every chapter transcript, keyed by chapter
+# number (written by scripts/pack_transcripts.py)
+TRANSCRIPTS_PACK = "transcripts.json"
+
+_TRANSCRIPT_PACK = TypeAdapter(dict[str, Transcript])
+
+# Parsed books keyed by (book_dir, metadata mtime), least recently used first
+_BOOK_CACHE_SIZE = 64
+_book_cache: OrderedDict[tuple[Path, int], tuple[Book, bytes]] = OrderedDict()
+
+# Cap concurrent transcript reads so large books don't exhaust file descriptors
+_transcript_reads = asyncio.Semaphore(16)
+
 
 def get_books_dir() -> Path:
     """Get the books directory path."""
@@ -49,12 +67,8 @@ def load_book_metadata(book_dir: Path) -> BookMetadata | None:
         return None
 
     try:
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return BookMetadata(**data)
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid metadata JSON in {metadata_path}: {e}")
-        return None
+        # Parse and validate in one pass (invalid JSON is a ValidationError too)
+        return BookMetadata.model_validate_json(metadata_path.read_bytes())
     except ValidationError as e:
         logger.error(f"Metadata validation failed for {metadata_path}: {e}")
         return None
@@ -71,12 +85,7 @@ def load_transcript(book_dir: Path, transcript_file: str) -> Transcript | None:
         return None
 
     try:
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return Transcript(**data)
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid transcript JSON in {transcript_path}: {e}")
-        return None
+        return Transcript.model_validate_json(transcript_path.read_bytes())
     except ValidationError as e:
         logger.error(f"Transcript validation failed for {transcript_path}: {e}")
         return None
@@ -85,34 +94,82 @@ def load_transcript(book_dir: Path, transcript_file: str) -> Transcript | None:
         return None
 
 
-def get_book_with_chapters(book_id: str) -> Book | None:
+def load_transcript_pack(book_dir: Path, min_mtime_ns: int) -> dict[str, Transcript] | None:
+    """Load the packed transcripts for a book, ignoring packs older than min_mtime_ns."""
+    pack_path = book_dir / TRANSCRIPTS_PACK
+    try:
+        if pack_path.stat().st_mtime_ns < min_mtime_ns:
+            logger.warning(f"Ignoring stale transcript pack: {pack_path}")
+            return None
+        return _TRANSCRIPT_PACK.validate_json(pack_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except ValidationError as e:
+        logger.error(f"Transcript pack validation failed for {pack_path}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Failed to load transcript pack from {pack_path}: {e}")
+        return None
+
+
+async def get_book_with_chapters(book_id: str) -> Book | None:
     """Get full book object with all chapters and transcripts loaded."""
+    cached = await _get_cached_book(book_id)
+    return cached[0] if cached else None
+
+
+async def get_book_json(book_id: str) -> bytes | None:
+    """Get the book as pre-encoded JSON, ready to send as a response body."""
+    cached = await _get_cached_book(book_id)
+    return cached[1] if cached else None
+
+
+async def _get_cached_book(book_id: str) -> tuple[Book, bytes] | None:
+    """Load a book along with its encoded JSON.
+
+    Both are cached and reused until metadata.json changes on disk.
+    File reads run in worker threads, with transcripts loaded concurrently.
+    """
     book_dir = resolve_book_dir(book_id)
 
-    if book_dir is None or not book_dir.exists():
+    if book_dir is None:
         return None
 
-    metadata = load_book_metadata(book_dir)
+    try:
+        stat = await asyncio.to_thread((book_dir / "metadata.json").stat)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    key = (book_dir, stat.st_mtime_ns)
+    cached = _book_cache.get(key)
+    if cached is not None:
+        _book_cache.move_to_end(key)
+        return cached
+
+    book = await _load_book(book_dir, stat.st_mtime_ns)
+    if book is None:
+        return None
+
+    cached = (book, to_json(book))
+    _book_cache[key] = cached
+    if len(_book_cache) > _BOOK_CACHE_SIZE:
+        _book_cache.popitem(last=False)
+    return cached
+
+
+async def _load_book(book_dir: Path, mtime_ns: int) -> Book | None:
+    """Load a book and its transcripts from disk."""
+    metadata = await asyncio.to_thread(load_book_metadata, book_dir)
     if metadata is None:
         return None
 
+    # One read for all transcripts when a fresh pack exists
+    packed = await asyncio.to_thread(load_transcript_pack, book_dir, mtime_ns) or {}
+
     # Build chapters with embedded transcripts
-    chapters: list[Chapter] = []
-    for ch_meta in metadata.chapters:
-        # Load transcript if available
-        transcript = None
-        if ch_meta.transcript_file:
-            transcript = load_transcript(book_dir, ch_meta.transcript_file)
-
-        chapters.append(
-            Chapter(
-                number=ch_meta.number,
-                title=ch_meta.title,
-                audio_file=ch_meta.audio_file,
-                duration_seconds=ch_meta.duration_seconds,
-                transcript=transcript,
-            )
-        )
+    chapters = await asyncio.gather(
+        *(_load_chapter(book_dir, ch_meta, packed) for ch_meta in metadata.chapters)
+    )
 
     return Book(
         id=metadata.id,
@@ -124,5 +181,133 @@ def get_book_with_chapters(book_id: str) -> Book | None:
         cover_image=metadata.cover_image,
         total_chapters=metadata.total_chapters,
         total_duration_seconds=metadata.total_duration_seconds,
-        chapters=chapters,
+        chapters=list(chapters),
     )
+
+
+async def _load_chapter(
+    book_dir: Path, ch_meta: ChapterMetadata, packed: dict[str, Transcript]
+) -> Chapter:
+    # Load transcript if available
+    transcript = packed.get(str(ch_meta.number))
+    if transcript is None and ch_meta.transcript_file:
+        async with _transcript_reads:
+            transcript = await asyncio.to_thread(
+                load_transcript, book_dir, ch_meta.transcript_file
+            )
+
+    return Chapter(
+        number=ch_meta.number,
+        title=ch_meta.title,
+        audio_file=ch_meta.audio_file,
+        duration_seconds=ch_meta.duration_seconds,
+        transcript=transcript,
+    )
+
+
+def scan_books(books_dir: Path) -> list[BookMetadata]:
+    """Load metadata for every book directory (blocking file I/O)."""
+    books: list[BookMetadata] = []
+    with os.scandir(books_dir) as entries:
+        # DirEntry.is_dir() uses the file type from the directory listing,
+        # so non-symlinks need no extra stat() call
+        book_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+    for book_dir in book_dirs:
+        metadata = load_book_metadata(book_dir)
+        if metadata is not None:
+            books.append(metadata)
+    return books
+
+
+def library_signature(books_dir: Path) -> tuple[tuple[str, int], ...] | None:
+    """Change marker for the library: (name, mtime) of every book directory.
+
+    Returns None if the books directory doesn't exist.
+    """
+    try:
+        with os.scandir(books_dir) as entries:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()
+            ))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+class LibraryIndex:
+    """In-memory index of the books directory.
+
+    The directory is scanned once up front and only rescanned when a book
+    directory is added, removed or modified, so listing the library never
+    touches the file system.
+    """
+
+    def __init__(self, books_dir: Path) -> None:
+        self.books_dir = books_dir
+        self.books: dict[str, BookMetadata] = {}
+        # Summaries hold cover_url relative to the books static mount
+        self.summaries: list[BookSummary] = []
+        self.signature: tuple[tuple[str, int], ...] | None = None
+        self._scanned = False
+
+    def refresh(self) -> bool:
+        """Rescan the books directory if it changed. Returns True if rescanned."""
+        signature = library_signature(self.books_dir)
+
+        if self._scanned and signature == self.signature:
+            return False
+
+        self._rebuild(signature)
+        return True
+
+    def _rebuild(self, signature: tuple[tuple[str, int], ...] | None) -> None:
+        books: dict[str, BookMetadata] = {}
+        summaries: list[BookSummary] = []
+
+        if signature is None:
+            logger.warning(f"Books directory not found: {self.books_dir}")
+            found = []
+        else:
+            found = scan_books(self.books_dir)
+
+        for metadata in found:
+            books[metadata.id] = metadata
+            cover_url = None
+            if metadata.cover_image:
+                cover_url = f"{metadata.id}/{metadata.cover_image}"
+
+            summaries.append(BookSummary(
+                id=metadata.id,
+                title=metadata.title,
+                author=metadata.author,
+                description=metadata.description,
+                cover_url=cover_url,
+                total_chapters=metadata.total_chapters,
+                total_duration_seconds=metadata.total_duration_seconds,
+            ))
+
+        summaries.sort(key=lambda b: b.title)
+
+        # Swap in the new state in one go so readers never see a partial index
+        self.books, self.summaries, self.signature = books, summaries, signature
+        self._scanned = True
+        logger.info(f"Library index rebuilt: {len(summaries)} books in {self.books_dir}")
+
+
+@lru_cache
+def get_library_index() -> LibraryIndex:
+    """Get the cached library index, scanning the books directory on first use."""
+    index = LibraryIndex(get_books_dir())
+    index.refresh()
+    return index
+
+
+async def watch_library(index: LibraryIndex, interval_seconds: float) -> None:
+    """Poll the books directory and refresh the index when it changes."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            # Rescans read from disk, keep them off the event loop
+            await asyncio.to_thread(index.refresh)
+        except Exception as e:
+            logger.error(f"Failed to refresh library index: {e}")
@@ -1,7 +1,6 @@
 from functools import lru_cache
 
 from .interface import VoiceOrchestrator
-from .livekit_impl import LiveKitOrchestrator
 
 # We can use an env var or settings to switch implementations later
 CURRENT_PROVIDER = "livekit"
@@ -10,6 +9,9 @@ CURRENT_PROVIDER = "livekit"
 def get_voice_orchestrator() -> VoiceOrchestrator:
     """Factory to get the configured VoiceOrchestrator instance."""
     if CURRENT_PROVIDER == "livekit":
+        # Imported lazily so the LiveKit SDK isn't loaded until the first token mint
+        from .livekit_impl import LiveKitOrchestrator
+
         return LiveKitOrchestrator()
     else:
         # Fallback or error for unknown provider
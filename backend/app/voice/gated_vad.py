@@ -0,0 +1,141 @@
+"""Energy-gated wrapper around a LiveKit VAD (Silero).
+
+Frames that are clearly below the adaptive noise floor while nobody is
+speaking are dropped before they reach the wrapped model, so the ONNX
+inference only runs on audio that might contain speech.
+"""
+
+import numpy as np
+from livekit import rtc
+from livekit.agents import vad
+from livekit.agents.metrics import VADMetrics
+
+# Lower bound for the noise floor (int16 RMS) so digital silence doesn't make
+# every subsequent frame look "loud"
+_MIN_NOISE_FLOOR = 10.0
+
+
+class GatedVAD(vad.VAD):
+    """VAD that skips inference on near-silent frames.
+
+    While the wrapped VAD reports speech, every frame is forwarded so it can
+    detect the end of the turn. Otherwise a frame is only forwarded if its RMS
+    is at least ``margin_db`` above an EMA of the noise floor, plus a short
+    hangover after loud frames so onsets and short words keep their context.
+
+    Once more than ``reset_after_seconds`` of audio has been dropped, the
+    wrapped stream is flushed before the next forwarded frame, so the model's
+    recurrent state starts fresh instead of continuing from audio long gone.
+    """
+
+    def __init__(
+        self,
+        inner: vad.VAD,
+        *,
+        margin_db: float = 6.0,
+        floor_alpha: float = 0.01,
+        hangover_seconds: float = 0.3,
+        reset_after_seconds: float = 1.0,
+    ) -> None:
+        super().__init__(capabilities=inner.capabilities)
+        self._inner = inner
+        self._margin_ratio = 10 ** (margin_db / 20)
+        self._floor_alpha = floor_alpha
+        self._hangover_seconds = hangover_seconds
+        self._reset_after_seconds = reset_after_seconds
+        # The inner model's streams report inference metrics on the inner VAD
+        inner.on("metrics_collected", self._forward_metrics)
+
+    @property
+    def model(self) -> str:
+        return self._inner.model
+
+    @property
+    def provider(self) -> str:
+        return self._inner.provider
+
+    def stream(self) -> "_GatedVADStream":
+        return _GatedVADStream(self, self._inner.stream())
+
+    def _forward_metrics(self, metrics: VADMetrics) -> None:
+        self.emit("metrics_collected", metrics)
+
+
+class _GatedVADStream:
+    """Gate in front of the wrapped VAD's stream.
+
+    Only the public VADStream API is used (push_frame/flush/end_input/aclose
+    and async iteration), so this doesn't depend on livekit's stream internals.
+    """
+
+    def __init__(self, gated: GatedVAD, inner: vad.VADStream) -> None:
+        self._gated = gated
+        self._inner = inner
+        self._noise_floor: float | None = None
+        self._speaking = False
+        self._hangover_remaining = 0.0
+        # Audio dropped since the last forwarded frame
+        self._skipped_seconds = 0.0
+
+    def push_frame(self, frame: rtc.AudioFrame) -> None:
+        if not self._should_forward(frame):
+            self._skipped_seconds += frame.samples_per_channel / frame.sample_rate
+            return
+
+        if self._skipped_seconds >= self._gated._reset_after_seconds:
+            # The model never saw the gap, so start a fresh segment
+            self._inner.flush()
+        self._skipped_seconds = 0.0
+        self._inner.push_frame(frame)
+
+    def flush(self) -> None:
+        self._skipped_seconds = 0.0
+        self._inner.flush()
+
+    def end_input(self) -> None:
+        self._inner.end_input()
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+    def __aiter__(self) -> "_GatedVADStream":
+        return self
+
+    async def __anext__(self) -> vad.VADEvent:
+        event = await self._inner.__anext__()
+        if event.type == vad.VADEventType.START_OF_SPEECH:
+            self._speaking = True
+        elif event.type == vad.VADEventType.END_OF_SPEECH:
+            self._speaking = False
+        return event
+
+    def _should_forward(self, frame: rtc.AudioFrame) -> bool:
+        samples = np.frombuffer(frame.data, dtype=np.int16)
+        if samples.size == 0:
+            return False
+
+        rms = max(float(np.sqrt(np.mean(np.square(samples, dtype=np.float32)))), _MIN_NOISE_FLOOR)
+
+        if self._noise_floor is None:
+            self._noise_floor = rms
+            return True
+
+        loud = rms >= self._noise_floor * self._gated._margin_ratio
+
+        if self._speaking:
+            # The model needs the trailing silence to end the turn
+            return True
+
+        # Only learn the floor from audio the model doesn't consider speech
+        alpha = self._gated._floor_alpha
+        self._noise_floor = (1 - alpha) * self._noise_floor + alpha * rms
+
+        if loud:
+            self._hangover_remaining = self._gated._hangover_seconds
+            return True
+
+        if self._hangover_remaining > 0:
+            self._hangover_remaining -= frame.samples_per_channel / frame.sample_rate
+            return True
+
+        return False
@@ -0,0 +1,77 @@
+"""Pre-rendered greeting clips for the voice agent.
+
+Greetings are fixed strings, so instead of asking the realtime model to say
+them on every connection we synthesize them once per voice (see
+scripts/render_greetings.py) and play the cached audio directly.
+"""
+
+import hashlib
+import logging
+import wave
+from pathlib import Path
+
+from livekit import rtc
+
+logger = logging.getLogger(__name__)
+
+GREETINGS_DIR = Path(__file__).parent.parent.parent / "greetings"
+
+# Voices the agent accepts from token metadata
+NARRATOR_VOICES = ("Puck", "Charon", "Kore", "Fenrir", "Aoede")
+
+_FRAME_MS = 20
+
+# (voice, text) -> decoded frames, or None if no clip exists
+_clip_cache: dict[tuple[str, str], list[rtc.AudioFrame] | None] = {}
+
+
+def greeting_text(book_title: str) -> str:
+    """Build the greeting spoken when a session starts."""
+    if book_title:
+        return f"Hey! I'm SageVox, your companion for {book_title}. What would you like to know?"
+    return "Hey! I'm SageVox, your audiobook companion. What would you like to know?"
+
+
+def greeting_clip_path(voice: str, text: str) -> Path:
+    """Location of the pre-rendered WAV for a voice and greeting text."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+    return GREETINGS_DIR / voice / f"{digest}.wav"
+
+
+def load_greeting_frames(voice: str, text: str) -> list[rtc.AudioFrame] | None:
+    """Get the cached greeting audio as 20ms frames, or None if not pre-rendered."""
+    key = (voice, text)
+    if key not in _clip_cache:
+        _clip_cache[key] = _read_clip(greeting_clip_path(voice, text))
+    return _clip_cache[key]
+
+
+def _read_clip(path: Path) -> list[rtc.AudioFrame] | None:
+    if not path.exists():
+        return None
+
+    try:
+        with wave.open(str(path), "rb") as wf:
+            sample_rate = wf.getframerate()
+            num_channels = wf.getnchannels()
+            if wf.getsampwidth() != 2:
+                raise ValueError("expected 16-bit PCM")
+            pcm = wf.readframes(wf.getnframes())
+    except (wave.Error, ValueError, OSError) as e:
+        logger.error(f"Failed to read greeting clip {path}: {e}")
+        return None
+
+    samples_per_frame = sample_rate * _FRAME_MS // 1000
+    bytes_per_frame = samples_per_frame * num_channels * 2
+    frames = []
+    for offset in range(0, len(pcm), bytes_per_frame):
+        chunk = pcm[offset:offset + bytes_per_frame]
+        frames.append(
+            rtc.AudioFrame(
+                data=chunk,
+                sample_rate=sample_rate,
+                num_channels=num_channels,
+                samples_per_channel=len(chunk) // (num_channels * 2),
+            )
+        )
+    return frames
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict
 
+import orjson
 from livekit import api
 
 from ..config import get_settings
@@ -14,6 +15,10 @@ class LiveKitOrchestrator(VoiceOrchestrator):
 
     def __init__(self) -> None:
         self.settings = get_settings()
+        # Credentials are fixed for the process; read them once
+        self._api_key = self.settings.livekit_api_key
+        self._api_secret = self.settings.livekit_api_secret
+        self._url = self.settings.livekit_url
 
     def generate_token(
         self,
@@ -23,7 +28,7 @@ class LiveKitOrchestrator(VoiceOrchestrator):
         metadata: Dict[str, Any],
     ) -> Dict[str, Any]:
         # Create the token
-        token = api.AccessToken(self.settings.livekit_api_key, self.settings.livekit_api_secret)
+        token = api.AccessToken(self._api_key, self._api_secret)
 
         # Set permissions
         token.with_identity(participant_identity).with_name(participant_name).with_grants(
@@ -35,9 +40,8 @@ class LiveKitOrchestrator(VoiceOrchestrator):
             )
         )
 
-        # Convert metadata to string as LiveKit expects string metadata
-        # We explicitly support string conversion for the dict
-        token.with_metadata(str(metadata))
+        # LiveKit expects string metadata; the agent parses it as JSON
+        token.with_metadata(orjson.dumps(metadata).decode("utf-8"))
 
         jwt = token.to_jwt()
 
@@ -45,7 +49,7 @@ class LiveKitOrchestrator(VoiceOrchestrator):
 
         return {
             "token": jwt,
-            "url": self.settings.livekit_url,
+            "url": self._url,
             "room": room_name,
             "identity": participant_identity,
             # Return provider type so client knows how to handle it if we switch
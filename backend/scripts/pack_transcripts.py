@@ -0,0 +1,49 @@
+"""Pack each book's per-chapter transcripts into a single transcripts.json.
+
+The API loads one file per book instead of one per chapter when the pack is
+present and at least as new as metadata.json.
+
+Usage (from backend/):
+    python scripts/pack_transcripts.py [BOOKS_DIR]
+"""
+
+import sys
+from pathlib import Path
+
+import orjson
+
+PACK_FILENAME = "transcripts.json"
+
+
+def pack_book(book_dir: Path) -> int:
+    """Write the transcript pack for one book. Returns the number of chapters packed."""
+    metadata = orjson.loads((book_dir / "metadata.json").read_bytes())
+
+    packed: dict[str, object] = {}
+    for chapter in metadata.get("chapters", []):
+        transcript_file = chapter.get("transcript_file")
+        if not transcript_file:
+            continue
+        transcript_path = book_dir / transcript_file
+        if not transcript_path.exists():
+            print(f"  missing {transcript_path.name}, skipped")
+            continue
+        packed[str(chapter["number"])] = orjson.loads(transcript_path.read_bytes())
+
+    (book_dir / PACK_FILENAME).write_bytes(orjson.dumps(packed))
+    return len(packed)
+
+
+def main() -> None:
+    default_dir = Path(__file__).resolve().parent.parent / "books"
+    books_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else default_dir
+
+    for book_dir in sorted(books_dir.iterdir()):
+        if not (book_dir / "metadata.json").exists():
+            continue
+        count = pack_book(book_dir)
+        print(f"{book_dir.name}: packed {count} transcripts")
+
+
+if __name__ == "__main__":
+    main()
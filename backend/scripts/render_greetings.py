@@ -0,0 +1,77 @@
+"""Pre-render the agent greeting for every narrator voice with Gemini TTS.
+
+Renders the generic greeting plus one per book title found in the books
+directory, into backend/greetings/<voice>/. The agent plays these clips
+directly and only falls back to the realtime model for titles without a clip.
+
+Usage (from backend/):
+    python -m scripts.render_greetings [BOOKS_DIR]
+"""
+
+import os
+import sys
+import wave
+from pathlib import Path
+
+import orjson
+from dotenv import load_dotenv
+from google import genai
+from google.genai import types
+
+from app.voice.greetings import NARRATOR_VOICES, greeting_clip_path, greeting_text
+
+TTS_MODEL = "gemini-2.5-flash-preview-tts"
+
+
+def book_titles(books_dir: Path) -> list[str]:
+    titles = []
+    for metadata_path in sorted(books_dir.glob("*/metadata.json")):
+        title = orjson.loads(metadata_path.read_bytes()).get("title")
+        if title:
+            titles.append(title)
+    return titles
+
+
+def synthesize(client: genai.Client, voice: str, text: str) -> bytes:
+    response = client.models.generate_content(
+        model=TTS_MODEL,
+        contents=f"Say warmly and naturally: {text}",
+        config=types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice)
+                )
+            ),
+        ),
+    )
+    parts = response.candidates[0].content.parts if response.candidates else []
+    return b"".join(p.inline_data.data for p in parts if p.inline_data)
+
+
+def main() -> None:
+    load_dotenv()
+    default_dir = Path(__file__).resolve().parent.parent / "books"
+    books_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else default_dir
+
+    client = genai.Client(api_key=os.environ["GOOGLE_API_KEY"])
+    texts = [greeting_text("")] + [greeting_text(t) for t in book_titles(books_dir)]
+
+    for voice in NARRATOR_VOICES:
+        for text in texts:
+            path = greeting_clip_path(voice, text)
+            if path.exists():
+                continue
+            pcm = synthesize(client, voice, text)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Gemini TTS returns 24kHz 16-bit mono PCM
+            with wave.open(str(path), "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(24000)
+                wf.writeframes(pcm)
+            print(f"{voice}: {text!r} -> {path.name}")
+
+
+if __name__ == "__main__":
+    main()
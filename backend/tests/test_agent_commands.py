@@ -0,0 +1,128 @@
+"""Tests for SageVoxAgent command batching over the data channel."""
+
+import asyncio
+
+import orjson
+import pytest
+
+import agent as agent_module
+from agent import SageVoxAgent
+
+
+class FakeParticipant:
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.sent: list = []
+        self.fail = fail
+        self.delay = delay
+
+    async def publish_data(self, payload: bytes, reliable: bool = True) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("data channel closed")
+        self.sent.append(orjson.loads(payload))
+
+
+class FakeRoom:
+    def __init__(self, participant: FakeParticipant):
+        self.local_participant = participant
+
+
+def make_agent(participant: FakeParticipant) -> SageVoxAgent:
+    return SageVoxAgent(instructions="test", room=FakeRoom(participant))
+
+
+def sent_commands(sent: list) -> list[str]:
+    """Flatten published messages into the order the client sees commands."""
+    names = []
+    for message in sent:
+        for command in message.get("commands", [message]):
+            names.append(command["command"])
+    return names
+
+
+@pytest.mark.asyncio
+async def test_lone_command_keeps_plain_shape():
+    participant = FakeParticipant()
+    agent = make_agent(participant)
+
+    await agent._send_command("skip_back", {"seconds": 30})
+
+    assert participant.sent == [{"command": "skip_back", "data": {"seconds": 30}}]
+
+
+@pytest.mark.asyncio
+async def test_commands_in_one_turn_are_batched_in_order():
+    participant = FakeParticipant()
+    agent = make_agent(participant)
+
+    await asyncio.gather(
+        agent._send_command("go_to_chapter", {"chapter": 3}),
+        agent._send_command("skip_forward", {"seconds": 10}),
+        agent._send_command("resume_playback"),
+    )
+
+    assert participant.sent == [
+        {
+            "commands": [
+                {"command": "go_to_chapter", "data": {"chapter": 3}},
+                {"command": "skip_forward", "data": {"seconds": 10}},
+                {"command": "resume_playback", "data": {}},
+            ]
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resume_does_not_overtake_in_flight_batch():
+    # The first batch is still being published when resume_playback arrives
+    participant = FakeParticipant(delay=0.05)
+    agent = make_agent(participant)
+
+    first = asyncio.create_task(agent._send_command("skip_back", {"seconds": 5}))
+    await asyncio.sleep(agent_module._COMMAND_BATCH_WINDOW_SECONDS * 2)
+    await agent._send_command("resume_playback")
+    await first
+
+    assert sent_commands(participant.sent) == ["skip_back", "resume_playback"]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_capped():
+    participant = FakeParticipant()
+    agent = make_agent(participant)
+    count = agent_module._COMMAND_BATCH_MAX + 2
+
+    await asyncio.gather(
+        *(agent._send_command("skip_forward", {"seconds": i}) for i in range(count))
+    )
+
+    assert len(participant.sent) == 2
+    assert len(participant.sent[0]["commands"]) == agent_module._COMMAND_BATCH_MAX
+    seconds = [
+        c["data"]["seconds"] for m in participant.sent for c in m.get("commands", [m])
+    ]
+    assert seconds == list(range(count))
+
+
+@pytest.mark.asyncio
+async def test_publish_failure_reaches_sender():
+    agent = make_agent(FakeParticipant(fail=True))
+
+    with pytest.raises(ConnectionError):
+        await agent._send_command("skip_back", {"seconds": 30})
+    with pytest.raises(ConnectionError):
+        await agent._send_command("resume_playback")
+
+
+@pytest.mark.asyncio
+async def test_on_exit_flushes_queued_commands():
+    participant = FakeParticipant()
+    agent = make_agent(participant)
+
+    pending = asyncio.create_task(agent._send_command("go_to_chapter", {"chapter": 2}))
+    await asyncio.sleep(0)
+    await agent.on_exit()
+
+    assert sent_commands(participant.sent) == ["go_to_chapter"]
+    await pending
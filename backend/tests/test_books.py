@@ -0,0 +1,65 @@
+"""Tests for the book listing endpoint."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+
+from app.routers import books
+from app.services.library import LibraryIndex
+
+
+def make_client(monkeypatch, books_dir: Path, mount: bool = True) -> TestClient:
+    """Build an app wired like main.py, mounting books only if the directory exists."""
+    index = LibraryIndex(books_dir)
+    index.refresh()
+    monkeypatch.setattr(books, "get_library_index", lambda: index)
+
+    app = FastAPI()
+    app.include_router(books.router)
+    if mount and books_dir.exists():
+        app.mount("/books", StaticFiles(directory=books_dir), name="books_static")
+    return TestClient(app)
+
+
+@pytest.fixture
+def books_dir(tmp_path: Path) -> Path:
+    book_dir = tmp_path / "books" / "gatsby"
+    book_dir.mkdir(parents=True)
+    (book_dir / "metadata.json").write_text(json.dumps({
+        "id": "gatsby",
+        "title": "The Great Gatsby",
+        "author": "F. Scott Fitzgerald",
+        "cover_image": "cover.jpg",
+    }))
+    return tmp_path / "books"
+
+
+def test_list_books_without_books_dir(monkeypatch, tmp_path):
+    client = make_client(monkeypatch, tmp_path / "missing")
+
+    response = client.get("/api/books")
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_list_books_resolves_cover_urls(monkeypatch, books_dir):
+    client = make_client(monkeypatch, books_dir)
+
+    [summary] = client.get("/api/books").json()
+
+    assert summary["cover_url"] == "http://testserver/books/gatsby/cover.jpg"
+
+
+def test_list_books_without_static_mount(monkeypatch, books_dir):
+    # A books directory that appeared after startup is never mounted
+    client = make_client(monkeypatch, books_dir, mount=False)
+
+    [summary] = client.get("/api/books").json()
+
+    assert summary["id"] == "gatsby"
+    assert summary["cover_url"] is None
@@ -0,0 +1,164 @@
+"""Tests for the energy-gated VAD wrapper."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from livekit import rtc
+from livekit.agents import vad
+
+from app.voice.gated_vad import GatedVAD
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 160  # 10 ms
+
+
+def make_frame(amplitude: int) -> rtc.AudioFrame:
+    samples = np.full(FRAME_SAMPLES, amplitude, dtype=np.int16)
+    return rtc.AudioFrame(samples.tobytes(), SAMPLE_RATE, 1, FRAME_SAMPLES)
+
+
+def make_event(event_type: vad.VADEventType) -> vad.VADEvent:
+    return vad.VADEvent(
+        type=event_type,
+        samples_index=0,
+        timestamp=0.0,
+        speech_duration=0.0,
+        silence_duration=0.0,
+    )
+
+
+class FakeStream:
+    """Stands in for the wrapped model's stream, recording what reaches it."""
+
+    def __init__(self) -> None:
+        self.frames: list[rtc.AudioFrame] = []
+        self.flushes = 0
+        self.ended = False
+        self.closed = False
+        self.events: asyncio.Queue[vad.VADEvent | None] = asyncio.Queue()
+
+    def push_frame(self, frame: rtc.AudioFrame) -> None:
+        self.frames.append(frame)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    def end_input(self) -> None:
+        self.ended = True
+        self.events.put_nowait(None)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> vad.VADEvent:
+        event = await self.events.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class FakeVAD(vad.VAD):
+    def __init__(self) -> None:
+        super().__init__(capabilities=vad.VADCapabilities(update_interval=0.032))
+        self.streams: list[FakeStream] = []
+
+    def stream(self) -> FakeStream:
+        stream = FakeStream()
+        self.streams.append(stream)
+        return stream
+
+
+def make_gated(**kwargs):
+    inner = FakeVAD()
+    stream = GatedVAD(inner, **kwargs).stream()
+    return stream, inner.streams[0]
+
+
+def test_quiet_frames_are_dropped_after_floor_is_learned():
+    stream, inner = make_gated(hangover_seconds=0.0)
+
+    for _ in range(20):
+        stream.push_frame(make_frame(100))
+
+    # Only the first frame (which seeds the noise floor) reaches the model
+    assert len(inner.frames) == 1
+
+
+def test_loud_frame_and_hangover_are_forwarded():
+    stream, inner = make_gated(hangover_seconds=0.03)
+    stream.push_frame(make_frame(100))
+
+    stream.push_frame(make_frame(5000))
+    for _ in range(5):
+        stream.push_frame(make_frame(100))
+
+    # Seed frame, loud frame, then 30 ms of hangover
+    assert len(inner.frames) == 1 + 1 + 3
+
+
+def test_inner_stream_is_reset_after_long_gated_silence():
+    stream, inner = make_gated(hangover_seconds=0.0, reset_after_seconds=0.5)
+    stream.push_frame(make_frame(100))
+
+    # 200 ms gap: the model keeps its state
+    for _ in range(20):
+        stream.push_frame(make_frame(100))
+    stream.push_frame(make_frame(5000))
+    assert inner.flushes == 0
+
+    # 600 ms gap: the model is reset before the next frame reaches it
+    for _ in range(60):
+        stream.push_frame(make_frame(100))
+    stream.push_frame(make_frame(5000))
+    assert inner.flushes == 1
+    assert len(inner.frames) == 3
+
+    # Forwarding restarts the gap count
+    stream.push_frame(make_frame(5000))
+    assert inner.flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_every_frame_is_forwarded_while_speaking():
+    stream, inner = make_gated(hangover_seconds=0.0)
+    stream.push_frame(make_frame(100))
+
+    inner.events.put_nowait(make_event(vad.VADEventType.START_OF_SPEECH))
+    assert (await anext(stream)).type == vad.VADEventType.START_OF_SPEECH
+    for _ in range(5):
+        stream.push_frame(make_frame(100))
+    assert len(inner.frames) == 6
+
+    inner.events.put_nowait(make_event(vad.VADEventType.END_OF_SPEECH))
+    assert (await anext(stream)).type == vad.VADEventType.END_OF_SPEECH
+    stream.push_frame(make_frame(100))
+    assert len(inner.frames) == 6
+
+
+@pytest.mark.asyncio
+async def test_control_calls_reach_inner_stream():
+    stream, inner = make_gated()
+
+    stream.flush()
+    stream.end_input()
+    events = [event async for event in stream]
+    await stream.aclose()
+
+    assert events == []
+    assert inner.flushes == 1
+    assert inner.ended and inner.closed
+
+
+def test_inner_metrics_are_reported_on_gated_vad():
+    inner = FakeVAD()
+    gated = GatedVAD(inner)
+    received = []
+    gated.on("metrics_collected", received.append)
+
+    inner.emit("metrics_collected", "metrics")
+
+    assert received == ["metrics"]
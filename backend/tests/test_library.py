@@ -0,0 +1,50 @@
+"""Tests for loading books and transcripts from disk."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.library import TRANSCRIPTS_PACK, _load_book, load_transcript_pack
+
+TRANSCRIPT = {"text": "In my younger years.", "duration": 2.0, "segments": []}
+
+
+@pytest.fixture
+def book_dir(tmp_path: Path) -> Path:
+    (tmp_path / "metadata.json").write_text(json.dumps({
+        "id": "gatsby",
+        "title": "The Great Gatsby",
+        "author": "F. Scott Fitzgerald",
+        "chapters": [{"number": 1, "title": "Chapter 1", "transcript_file": "ch1.json"}],
+    }))
+    (tmp_path / "ch1.json").write_text(json.dumps(TRANSCRIPT))
+    return tmp_path
+
+
+def test_load_transcript_pack(book_dir):
+    (book_dir / TRANSCRIPTS_PACK).write_text(json.dumps({"1": TRANSCRIPT}))
+
+    pack = load_transcript_pack(book_dir, 0)
+
+    assert pack["1"].text == TRANSCRIPT["text"]
+
+
+@pytest.mark.parametrize("pack", ["truncated", "unreadable"])
+def test_load_transcript_pack_rejects_broken_pack(book_dir, pack):
+    pack_path = book_dir / TRANSCRIPTS_PACK
+    if pack == "truncated":
+        pack_path.write_text(json.dumps({"1": TRANSCRIPT})[:20])
+    else:
+        pack_path.mkdir()
+
+    assert load_transcript_pack(book_dir, 0) is None
+
+
+@pytest.mark.asyncio
+async def test_broken_pack_falls_back_to_chapter_files(book_dir):
+    (book_dir / TRANSCRIPTS_PACK).mkdir()
+
+    book = await _load_book(book_dir, 0)
+
+    assert book.chapters[0].transcript.text == TRANSCRIPT["text"]
@@ -0,0 +1,55 @@
+"""Tests for BookContext summary caching."""
+
+import dataclasses
+
+from app.models import BookContext
+
+
+def make_context(**kwargs) -> BookContext:
+    return BookContext(
+        book_id="gatsby",
+        title="The Great Gatsby",
+        author="F. Scott Fitzgerald",
+        narrator_voice="Kore",
+        current_chapter=1,
+        total_chapters=9,
+        **kwargs,
+    )
+
+
+def test_context_joins_summaries_up_to_chapter():
+    ctx = make_context(chapter_summaries={1: "Nick arrives.", 3: "The party."})
+
+    assert ctx.get_context_up_to_chapter(2) == "Chapter 1: Nick arrives."
+    assert ctx.get_context_up_to_chapter(3) == "Chapter 1: Nick arrives.\nChapter 3: The party."
+    assert make_context().get_context_up_to_chapter(3) == "No chapter summaries available."
+
+
+def test_set_chapter_summary_refreshes_later_chapters_only():
+    ctx = make_context(chapter_summaries={1: "Nick arrives."})
+    for chapter in range(1, 5):
+        ctx.get_context_up_to_chapter(chapter)
+
+    ctx.set_chapter_summary(3, "The party.")
+
+    assert set(ctx._context_cache) == {1, 2}
+    assert ctx.get_context_up_to_chapter(4) == "Chapter 1: Nick arrives.\nChapter 3: The party."
+    assert ctx.get_context_up_to_chapter(2) == "Chapter 1: Nick arrives."
+
+
+def test_context_supports_dataclass_helpers():
+    ctx = make_context(chapter_summaries={1: "Nick arrives."})
+    ctx.get_context_up_to_chapter(1)
+
+    assert dataclasses.asdict(ctx)["chapter_summaries"] == {1: "Nick arrives."}
+    assert ctx == make_context(chapter_summaries={1: "Nick arrives."})
+    assert "_context_cache" not in repr(ctx)
+
+
+def test_replace_starts_with_fresh_cache():
+    ctx = make_context(chapter_summaries={1: "Nick arrives."})
+    ctx.get_context_up_to_chapter(1)
+    copy = dataclasses.replace(ctx, chapter_summaries={1: "changed"})
+
+    assert ctx.get_context_up_to_chapter(1) == "Chapter 1: Nick arrives."
+    assert copy.get_context_up_to_chapter(1) == "Chapter 1: changed"
@@ -1,48 +1,299 @@
-"""Command-line interface for SageVox Converter."""
+"""Command-line interface for SageVox Converter.
 
+Heavy dependencies (the Gemini SDK, bs4/lxml, mutagen and most of rich) are
+imported inside the commands that use them, so `--help` and `voices` start fast.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-from rich.prompt import Prompt
 from dotenv import load_dotenv
 
-from .models import BookMetadata
-from .epub_parser import parse_epub, parse_epub_sections, sections_to_chapters, create_book_metadata
-from .tts_service import GeminiTTSService
+from .models import BookMetadata, Chapter, hash_text
+from .storage import copy_zip_entry_if_changed
+from .voices import (
+    AVAILABLE_VOICES,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_RPM,
+    DEFAULT_SERVICE_TIER,
+    DEFAULT_TPM,
+    SERVICE_TIERS,
+    VOICE_STYLES,
+)
+
+if TYPE_CHECKING:
+    from .tts_service import GeminiTTSService
 
 
 load_dotenv()
 console = Console()
 
+# Section titles treated as front matter when building the chapter list
+_FRONT_MATTER_RE = re.compile(
+    r"table\s*of\s*contents|^contents$|^toc$|copyright|dedication|acknowledgments?"
+    r"|title\s*page|about\s*the\s*author|also\s*by|^cover$",
+    re.IGNORECASE,
+)
+# Audio smaller than this is treated as a leftover from a failed write
+MIN_AUDIO_BYTES = 1024
+# Chapters planned ahead of the synthesis workers in _pooled_chapters
+_PREPARE_LOOKAHEAD = 2
+
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[\s_-]+")
 
 def slugify(text: str) -> str:
-    import re
-    text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
-    return text.strip("-")
+    return _SLUG_DASH.sub("-", _SLUG_STRIP.sub("", text.lower())).strip("-")
 
 
 def parse_section_selection(selection: str, max_index: int) -> list[int]:
-    indices = []
+    # Bitset over 1..max_index, so huge ranges never materialize as ints
+    mask = bytearray(max_index + 1)
     for part in selection.replace(" ", "").split(","):
-        if "-" in part:
-            try:
-                start, end = part.split("-", 1)
-                indices.extend(range(int(start), int(end) + 1))
-            except ValueError:
-                continue
+        try:
+            if "-" in part:
+                start_str, end_str = part.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = end = int(part)
+        except ValueError:
+            continue
+        start, end = max(start, 1), min(end, max_index)
+        if start <= end:
+            mask[start:end + 1] = b"\x01" * (end - start + 1)
+    return [i for i, selected in enumerate(mask) if selected]
+
+
+def _wav_duration(path: Path) -> float:
+    """Duration of a PCM WAV from its RIFF chunk headers, without touching the samples."""
+    with open(path, "rb") as f:
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:] != b"WAVE":
+            raise ValueError(f"{path.name} is not a WAV file")
+
+        byte_rate = 0
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path.name} has no data chunk")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                byte_rate = struct.unpack_from("<I", f.read(size), 8)[0]
+                f.seek(size & 1, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if not byte_rate:
+                    raise ValueError(f"{path.name} has no fmt chunk before its data")
+                # Clamp to what's actually on disk in case the writer was interrupted
+                size = min(size, os.fstat(f.fileno()).st_size - f.tell())
+                return size / byte_rate
+            else:
+                # Chunks are word-aligned
+                f.seek(size + (size & 1), os.SEEK_CUR)
+
+
+@lru_cache(maxsize=1024)
+def _cached_audio_duration(path: Path, mtime_ns: int, size: int) -> float:
+    if path.suffix == '.wav':
+        return _wav_duration(path)
+    from mutagen.mp3 import MP3
+
+    # mutagen only reads the MP3 headers (Xing/VBRI or first frame)
+    return float(MP3(path).info.length)
+
+
+def _audio_duration(path: Path, st: Optional[os.stat_result] = None) -> float:
+    """Duration of an existing chapter audio file, memoized per path/mtime/size."""
+    if st is None:
+        st = path.stat()
+    return _cached_audio_duration(path, st.st_mtime_ns, st.st_size)
+
+
+def _reusable_audio(
+    chapter: Chapter,
+    output: Path,
+    content_hash: str,
+    verify_hash: bool,
+    existing_files: dict[str, os.DirEntry],
+) -> Optional[tuple[str, float, Optional[str]]]:
+    """The chapter's existing audio, if it can be kept instead of regenerated.
+
+    Returns:
+        Tuple of (audio_file, duration_seconds, transcript_file), or None
+    """
+    mp3_name = f"chapter-{chapter.number:02d}.mp3"
+    wav_name = f"chapter-{chapter.number:02d}.wav"
+    transcript_name = f"chapter-{chapter.number:02d}-transcript.json"
+
+    # Only trust existing audio that was recorded as finished for this exact text.
+    # Metadata written before hashes existed falls back to the recorded audio_file.
+    if verify_hash:
+        is_current = chapter.content_hash == content_hash or (
+            chapter.content_hash is None and chapter.audio_file is not None
+        )
+    else:
+        is_current = True
+
+    entry = existing_files.get(mp3_name) or existing_files.get(wav_name)
+    if not is_current or entry is None:
+        return None
+    existing = Path(entry.path)
+    try:
+        st = entry.stat()
+        if st.st_size < MIN_AUDIO_BYTES:
+            raise ValueError(f"{existing.name} is truncated")
+        duration = _audio_duration(existing, st)
+    except Exception:
+        return None
+    transcript_file = transcript_name if transcript_name in existing_files else None
+    return existing.name, duration, transcript_file
+
+
+def _do_chapter(
+    chapter: Chapter,
+    tts: GeminiTTSService,
+    output: Path,
+    style: Optional[str],
+    narrator_style: str,
+    skip_existing: bool,
+    verify_hash: bool,
+    existing_files: dict[str, os.DirEntry],
+    prepared: Future,
+) -> tuple[str, float, Optional[str], str, bool]:
+    """Synthesize one chapter (or pick up its existing audio).
+
+    Runs on a worker thread, so it only returns results; the caller assigns
+    them to the chapter. ``existing_files`` is a scan of the output directory
+    taken before the run, so no per-chapter stat calls are needed, and
+    ``prepared`` resolves to the chapter's chunks from tts.prepare_chapter.
+
+    Returns:
+        Tuple of (audio_file, duration_seconds, transcript_file, content_hash, skipped)
+    """
+    content_hash = hash_text(chapter.text_content)
+
+    # Skip existing
+    if skip_existing:
+        reused = _reusable_audio(chapter, output, content_hash, verify_hash, existing_files)
+        if reused is not None:
+            prepared.cancel()
+            return (*reused, content_hash, True)
+
+    # Generate audio + transcript
+    audio_file, duration, transcript = tts.synthesize_chapter(
+        chapter,
+        output,
+        style_prompt=style,
+        narrator_style=narrator_style,
+        chunks=prepared.result(),
+    )
+
+    # Save transcript on the worker and return only its name, so the segment
+    # list is freed as soon as this chapter is done
+    transcript_path = output / f"chapter-{chapter.number:02d}-transcript.json"
+    transcript.save(transcript_path)
+    return audio_file, duration, transcript_path.name, content_hash, False
+
+
+def _pooled_chapters(
+    chapters: list[Chapter],
+    tts: GeminiTTSService,
+    output: Path,
+    style: Optional[str],
+    narrator_style: str,
+    skip_existing: bool,
+    verify_hash: bool,
+    existing_files: dict[str, os.DirEntry],
+    workers: int,
+) -> Iterator[tuple[Chapter, Future]]:
+    """Run _do_chapter for each chapter on a thread pool, yielding as they finish.
+
+    Only ``workers + _PREPARE_LOOKAHEAD`` chapters are in flight at a time, so
+    chunk plans are built just ahead of the workers that need them.
+    """
+    remaining = iter(chapters)
+    # Sentence splitting runs ahead on its own small pool, overlapping
+    # with the synthesis workers' network waits
+    with ThreadPoolExecutor(max_workers=2) as prep, ThreadPoolExecutor(max_workers=workers) as ex:
+
+        def submit(ch: Chapter) -> Future:
+            return ex.submit(
+                _do_chapter, ch, tts, output, style, narrator_style,
+                skip_existing, verify_hash, existing_files,
+                prep.submit(tts.prepare_chapter, ch),
+            )
+
+        futures = {submit(ch): ch for ch in islice(remaining, workers + _PREPARE_LOOKAHEAD)}
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for fut in done:
+                # Top the pipeline up before handing the result back
+                for ch in islice(remaining, 1):
+                    futures[submit(ch)] = ch
+                yield futures.pop(fut), fut
+
+
+def _batch_chapters(
+    chapters: list[Chapter],
+    tts: GeminiTTSService,
+    output: Path,
+    style: Optional[str],
+    narrator_style: str,
+    skip_existing: bool,
+    verify_hash: bool,
+    existing_files: dict[str, os.DirEntry],
+) -> Iterator[tuple[Chapter, Future]]:
+    """Like _pooled_chapters, but synthesizes everything in one Gemini batch job.
+
+    Chapters with reusable audio are yielded right away; the rest once the
+    job has finished.
+    """
+    pending: list[Chapter] = []
+    content_hashes: dict[int, str] = {}
+    for ch in chapters:
+        content_hash = content_hashes[ch.number] = hash_text(ch.text_content)
+        reused = _reusable_audio(ch, output, content_hash, verify_hash, existing_files) if skip_existing else None
+        if reused is None:
+            pending.append(ch)
         else:
+            done: Future = Future()
+            done.set_result((*reused, content_hash, True))
+            yield ch, done
+
+    results = tts.synthesize_chapters_batch(pending, output, style_prompt=style, narrator_style=narrator_style)
+    reported: set[int] = set()
+    try:
+        for ch, result in results:
+            reported.add(ch.number)
+            done = Future()
             try:
-                indices.append(int(part))
-            except ValueError:
+                audio_file, duration, transcript = result.result()
+                transcript_path = output / f"chapter-{ch.number:02d}-transcript.json"
+                transcript.save(transcript_path)
+            except Exception as e:
+                done.set_exception(e)
+            else:
+                done.set_result((audio_file, duration, transcript_path.name, content_hashes[ch.number], False))
+            yield ch, done
+    except Exception as e:
+        # The job as a whole failed; report it against every chapter it held
+        for ch in pending:
+            if ch.number in reported:
                 continue
-    return sorted(set(i for i in indices if 1 <= i <= max_index))
+            failed: Future = Future()
+            failed.set_exception(e)
+            yield ch, failed
 
 
 @click.group()
@@ -54,14 +305,19 @@ def main():
 
 @main.command()
 @click.argument("epub_path", type=click.Path(exists=True, path_type=Path))
-def sections(epub_path: Path):
+@click.option("--no-cache", is_flag=True, help="Re-parse the ePub instead of using the parse cache")
+def sections(epub_path: Path, no_cache: bool):
     """List all sections in an ePub file."""
+    from rich.table import Table
+
+    from .epub_parser import load_epub_sections
+
     console.print(f"\n[bold blue]SageVox - Section Viewer[/bold blue]")
     console.print(f"File: [cyan]{epub_path}[/cyan]\n")
     
     with console.status("[bold green]Parsing ePub..."):
         try:
-            parsed = parse_epub_sections(epub_path)
+            parsed = load_epub_sections(epub_path, use_cache=not no_cache)
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             sys.exit(1)
@@ -85,7 +341,7 @@ def sections(epub_path: Path):
 @main.command()
 @click.argument("epub_path", type=click.Path(exists=True, path_type=Path))
 @click.option("-o", "--output", type=click.Path(path_type=Path), help="Output directory")
-@click.option("-v", "--voice", default="Kore", type=click.Choice(GeminiTTSService.AVAILABLE_VOICES, case_sensitive=False))
+@click.option("-v", "--voice", default="Kore", type=click.Choice(AVAILABLE_VOICES, case_sensitive=False))
 @click.option("-l", "--language", default="en-US", help="Language code")
 @click.option("--narrator-style", type=click.Choice(["classic", "dramatic", "calm", "energetic"], case_sensitive=False), default="classic", help="Narrator style preset")
 @click.option("--style", default=None, help="Custom style prompt (overrides --narrator-style)")
@@ -96,7 +352,17 @@ def sections(epub_path: Path):
 @click.option("--dry-run", is_flag=True, help="Parse only, don't generate")
 @click.option("--skip-existing/--no-skip-existing", default=True)
 @click.option("--force", is_flag=True, help="Overwrite existing")
+@click.option("--verify-hash/--no-verify-hash", default=True, help="Only skip chapters whose recorded text hash matches")
 @click.option("--include-headings", is_flag=True, help="Include H1-H6 in audio")
+@click.option("--workers", type=click.IntRange(min=1), default=4, help="Chapters to synthesize concurrently")
+@click.option("--chunk-workers", type=click.IntRange(min=1), default=DEFAULT_MAX_CONCURRENT, help="TTS requests in flight per chapter")
+@click.option("--rpm", type=click.IntRange(min=1), default=DEFAULT_RPM, help="TTS requests per minute quota")
+@click.option("--tpm", type=click.IntRange(min=1), default=DEFAULT_TPM, help="TTS input tokens per minute quota")
+@click.option("--service-tier", type=click.Choice(SERVICE_TIERS, case_sensitive=False), default=DEFAULT_SERVICE_TIER, help="Gemini service tier for TTS requests")
+@click.option("--no-cache", is_flag=True, help="Re-parse the ePub instead of using the parse cache")
+@click.option("--no-tts-cache", is_flag=True, help="Regenerate all audio instead of reusing cached chunks")
+@click.option("--no-reorder", is_flag=True, help="Dispatch chapters in book order instead of longest first")
+@click.option("--batch", is_flag=True, help="Submit all chapters as one Gemini batch job (cheaper, but asynchronous)")
 def convert(
     epub_path: Path,
     output: Optional[Path],
@@ -111,15 +377,42 @@ def convert(
     dry_run: bool,
     skip_existing: bool,
     force: bool,
+    verify_hash: bool,
     include_headings: bool,
+    workers: int,
+    chunk_workers: int,
+    rpm: int,
+    tpm: int,
+    service_tier: str,
+    no_cache: bool,
+    no_tts_cache: bool,
+    no_reorder: bool,
+    batch: bool,
 ):
     """Convert an ePub file to a SageVox audiobook."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from .epub_parser import load_epub_sections, sections_to_chapters, create_book_metadata
+    from .tts_service import (
+        BATCH_SUPPORTED,
+        TTS_CACHE_DIR,
+        GeminiTTSService,
+        RateLimiter,
+        find_mp3_encoder,
+    )
+
+    if batch and not BATCH_SUPPORTED:
+        console.print("[red]Error:[/red] --batch needs google-genai 1.22 or newer")
+        sys.exit(1)
+
     console.print(f"\n[bold blue]SageVox Converter[/bold blue]")
     console.print(f"Converting: [cyan]{epub_path}[/cyan]\n")
     
     with console.status("[bold green]Parsing ePub..."):
         try:
-            parsed = parse_epub_sections(epub_path)
+            parsed = load_epub_sections(epub_path, use_cache=not no_cache)
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             sys.exit(1)
@@ -137,25 +430,13 @@ def convert(
     # If the user supplied specific sections, we assume those ARE the chapters they care about?
     # No, usually they select specific chapters to process from the whole.
     
-    all_content_indices = []
-    
-    # Logic from parse_epub default filtering
-    front_matter_patterns = [
-        r"table\s*of\s*contents", r"^contents$", r"^toc$", r"copyright",
-        r"dedication", r"acknowledgments?", r"title\s*page",
-        r"about\s*the\s*author", r"also\s*by", r"^cover$",
+    # Logic from parse_epub default filtering: enough words and not front matter
+    search_front_matter = _FRONT_MATTER_RE.search
+    all_content_indices = [
+        section.index
+        for section in parsed.sections
+        if section.word_count >= 100 and not search_front_matter(section.title)
     ]
-    import re
-    
-    for section in parsed.sections:
-        # Default criteria
-        if section.word_count < 100: continue
-        is_front = False
-        for p in front_matter_patterns:
-            if re.search(p, section.title.lower(), re.IGNORECASE):
-                is_front = True; break
-        if not is_front:
-            all_content_indices.append(section.index)
 
     # If user selected specific sections, we treat those as the target for processing,
     # BUT we still define the book structure based on ALL content (unless we want to redefine the book).
@@ -195,6 +476,7 @@ def convert(
                     new_ch.duration_seconds = old_ch.duration_seconds
                 if old_ch.transcript_file:
                     new_ch.transcript_file = old_ch.transcript_file
+                new_ch.content_hash = old_ch.content_hash
 
     # 4. Determine Chapters to Process in this run
     chapters_to_process = []
@@ -226,10 +508,12 @@ def convert(
         # Since sections_to_chapters lost that info, we reconstruct the map roughly:
         # parsed.chapters corresponds 1:1 to all_content_indices.
         if len(parsed.chapters) == len(all_content_indices):
-            for i, ch in enumerate(parsed.chapters):
-                section_idx = all_content_indices[i]
-                if section_idx in selected_indices:
-                    chapters_to_process.append(ch)
+            selected_set = frozenset(selected_indices)
+            chapters_to_process = [
+                ch
+                for ch, section_idx in zip(parsed.chapters, all_content_indices)
+                if section_idx in selected_set
+            ]
         else:
             console.print("[red]Warning: Chapter/Section mapping mismatch. Converting based on selection impossible (fallback to all).[/red]")
             chapters_to_process = parsed.chapters
@@ -257,16 +541,35 @@ def convert(
     console.print(f"[green]Voice:[/green] {voice}")
     console.print(f"[green]Narrator Style:[/green] {narrator_style}" + (" (custom)" if style else "") + "\n")
     
-    if parsed.cover_data:
+    if parsed.cover_zip_name:
         cover_path = output / f"cover.{parsed.cover_extension}"
-        with open(cover_path, "wb") as f:
-            f.write(parsed.cover_data)
-        metadata.cover_image = cover_path.name
+        try:
+            copy_zip_entry_if_changed(parsed.epub_path, parsed.cover_zip_name, cover_path)
+            metadata.cover_image = cover_path.name
+        except KeyError:
+            # The manifest names a cover that isn't in the archive
+            console.print(
+                f"[yellow]Cover '{parsed.cover_zip_name}' missing from ePub, skipping[/yellow]"
+            )
     
-    tts = GeminiTTSService(voice=voice, language_code=language)
+    # Shared by all workers so the pool as a whole stays under the quota
+    tts = GeminiTTSService(
+        voice=voice,
+        language_code=language,
+        rate_limiter=RateLimiter(rpm=rpm, tpm=tpm),
+        max_concurrent=chunk_workers,
+        service_tier=service_tier,
+        cache_dir=None if no_tts_cache else TTS_CACHE_DIR,
+    )
     
     skip_existing_chapters = skip_existing and not force
     
+    # Probed once here rather than from every worker thread
+    if find_mp3_encoder() is None:
+        console.print(
+            "[yellow]Warning: ffmpeg with libmp3lame not found, chapters will be saved as WAV[/yellow]"
+        )
+    
     # Calculate total duration from metadata (including existing) + updates
     # We will update individual chapters and assume the sum is correct at end.
     
@@ -276,65 +579,68 @@ def convert(
     with Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
         BarColumn(), TaskProgressColumn(), console=console,
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task("Converting...", total=len(chapters_to_process))
+        # Description changes are throttled to the refresh rate
+        last_description_update = 0.0
         
-        for chapter in chapters_to_process:
-            progress.update(task, description=f"Chapter {chapter.number}: {chapter.title[:25]}...")
-            
-            mp3_path = output / f"chapter-{chapter.number:02d}.mp3"
-            wav_path = output / f"chapter-{chapter.number:02d}.wav"
-            transcript_path = output / f"chapter-{chapter.number:02d}-transcript.json"
-            
-            # Skip existing
-            if skip_existing_chapters and (mp3_path.exists() or wav_path.exists()):
-                # Update metadata if needed
-                existing = mp3_path if mp3_path.exists() else wav_path
-                try:
-                    import wave
-                    if existing.suffix == '.wav':
-                        with wave.open(str(existing), 'rb') as wf:
-                            duration = wf.getnframes() / float(wf.getframerate())
-                    else:
-                        duration = existing.stat().st_size / 24000 # Rough approx if MP3
-                        # Ideally load metadata duration
-                    
-                    chapter.audio_file = existing.name
-                    if chapter.duration_seconds == 0: chapter.duration_seconds = duration
-                    if transcript_path.exists():
-                        chapter.transcript_file = transcript_path.name
-                    
-                    skipped += 1
-                    progress.advance(task)
-                    continue
-                except Exception:
-                    pass
-            
+        # Chapters are independent network-bound requests, so synthesize several at once
+        # Longest chapters first so a long one doesn't start last and stretch the tail
+        if no_reorder:
+            dispatch_order = chapters_to_process
+        else:
+            dispatch_order = sorted(chapters_to_process, key=lambda c: len(c.text_content), reverse=True)
+
+        # One directory scan instead of several stat calls per chapter
+        with os.scandir(output) as entries:
+            existing_files = {e.name: e for e in entries if e.is_file()}
+
+        if batch:
+            outcomes = _batch_chapters(
+                dispatch_order, tts, output, style, narrator_style,
+                skip_existing_chapters, verify_hash, existing_files,
+            )
+        else:
+            outcomes = _pooled_chapters(
+                dispatch_order, tts, output, style, narrator_style,
+                skip_existing_chapters, verify_hash, existing_files, workers,
+            )
+
+        for chapter, fut in outcomes:
             try:
-                # Generate audio + transcript
-                audio_file, duration, transcript = tts.synthesize_chapter(
-                    chapter, 
-                    output, 
-                    style_prompt=style,
-                    narrator_style=narrator_style
-                )
-                
-                chapter.audio_file = audio_file
-                chapter.duration_seconds = duration
-                
-                # Save transcript
-                transcript_file = f"chapter-{chapter.number:02d}-transcript.json"
-                transcript.save(output / transcript_file)
-                chapter.transcript_file = transcript_file
-                
-                generated_count += 1
-                
+                audio_file, duration, transcript_file, content_hash, was_skipped = fut.result()
             except Exception as e:
                 console.print(f"\n[red]Error on chapter {chapter.number}:[/red] {e}")
                 continue
-            
+            encoder_error = tts.encoder_errors.pop(chapter.number, None)
+            if encoder_error:
+                console.print(f"[yellow]Chapter {chapter.number}: {encoder_error}, kept WAV[/yellow]")
+
+            now = time.monotonic()
+            if now - last_description_update >= 0.25:
+                progress.update(task, description=f"Chapter {chapter.number}: {chapter.title[:25]}...")
+                last_description_update = now
+            chapter.audio_file = audio_file
+            chapter.content_hash = content_hash
+            if transcript_file:
+                chapter.transcript_file = transcript_file
+
+            if was_skipped:
+                # Update metadata if needed
+                if chapter.duration_seconds == 0: chapter.duration_seconds = duration
+                skipped += 1
+            else:
+                chapter.duration_seconds = duration
+                generated_count += 1
+
+            # The text is only needed for synthesis; release it so long books
+            # don't keep every chapter's text alive for the whole run
+            chapter.text_content = ""
+            # Record completion right away so a crash doesn't lose finished chapters
+            metadata.save(output)
             progress.advance(task)
-    
+
     if skipped > 0:
         console.print(f"[yellow]Skipped {skipped} existing[/yellow]")
     
@@ -352,24 +658,13 @@ def convert(
 @main.command()
 def voices():
     """List available narrator voices."""
+    from rich.table import Table
+
     table = Table(title="Available Voices")
     table.add_column("Voice", style="cyan")
     table.add_column("Style")
     
-    voices = {
-        "Kore": "Firm", "Charon": "Informative", "Puck": "Upbeat",
-        "Fenrir": "Excitable", "Aoede": "Breezy", "Leda": "Youthful",
-        "Zephyr": "Bright", "Orus": "Firm", "Autonoe": "Bright",
-        "Enceladus": "Breathy", "Iapetus": "Clear", "Umbriel": "Easy-going",
-        "Algieba": "Smooth", "Despina": "Smooth", "Erinome": "Clear",
-        "Algenib": "Gravelly", "Rasalgethi": "Informative",
-        "Laomedeia": "Upbeat", "Achernar": "Soft", "Alnilam": "Firm",
-        "Schedar": "Even", "Gacrux": "Mature", "Pulcherrima": "Forward",
-        "Achird": "Friendly", "Zubenelgenubi": "Casual",
-        "Vindemiatrix": "Gentle", "Sadachbia": "Lively",
-        "Sadaltager": "Knowledgeable", "Sulafat": "Warm",
-    }
-    for v, s in voices.items():
+    for v, s in VOICE_STYLES.items():
         table.add_row(v, s)
     console.print(table)
 
@@ -1,18 +1,64 @@
 """ePub parsing and chapter extraction with ToC-based section detection."""
 
+import hashlib
+import os
+import pickle
+import posixpath
 import re
+import tempfile
+import warnings
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, TypeVar, Union
 from dataclasses import dataclass, field
 from urllib.parse import unquote
 
-import ebooklib
-from ebooklib import epub
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag, XMLParsedAsHTMLWarning
+from lxml import etree
 
 from .models import Chapter, BookMetadata
 
 
+# BeautifulSoup backend; lxml's C parser is much faster than html.parser
+_PARSER = "lxml"
+
+# Only <body> is ever read, so nothing in <head> is turned into tree nodes
+_CONTENT_STRAINER = SoupStrainer("body")
+
+# Elements whose text is never narrated
+_NON_CONTENT_TAGS = frozenset(["script", "style", "nav", "header", "footer"])
+_HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+
+# String types get_text() includes (exact types, so comments etc. are left out)
+_TEXT_TYPES = (NavigableString, CData)
+
+# Package (OPF/NCX/nav) files are read with lxml directly; recover from
+# sloppy markup and never resolve external entities
+_XML_PARSER = etree.XMLParser(recover=True, resolve_entities=False)
+_NS = {
+    "container": "urn:oasis:names:tc:opendocument:xmlns:container",
+    "opf": "http://www.idpf.org/2007/opf",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "ncx": "http://www.daisy.org/z3986/2005/ncx/",
+}
+_XHTML_MEDIA_TYPE = "application/xhtml+xml"
+_COVER_NAME_RE = re.compile("cover", re.IGNORECASE)
+
+# Books needing at least this many documents parsed use a process pool;
+# for smaller ones worker start-up costs more than it saves
+_PARALLEL_MIN_DOCUMENTS = 16
+
+T = TypeVar("T")
+
+# Parsed ePubs are cached here, keyed by path, mtime and size
+EPUB_CACHE_DIR = Path.home() / ".cache" / "sagevox" / "epub"
+# Bump when the parser output changes so stale pickles are ignored
+_EPUB_CACHE_VERSION = 5
+
+
 @dataclass
 class Section:
     """Represents a section/document in the ePub."""
@@ -21,7 +67,7 @@ class Section:
     title: str  # Extracted title
     word_count: int
     text_content: str
-    raw_html: str
+    text_content_no_headings: str  # Audio text: text_content minus H1-H6
     
 
 @dataclass
@@ -32,7 +78,9 @@ class ParsedEpub:
     description: str
     sections: list[Section] = field(default_factory=list)
     chapters: list[Chapter] = field(default_factory=list)
-    cover_data: Optional[bytes] = None
+    epub_path: Optional[Path] = None
+    # Cover image entry inside the ePub zip, copied out on demand
+    cover_zip_name: Optional[str] = None
     cover_extension: str = "jpg"
 
 
@@ -47,115 +95,215 @@ SKIP_PATTERNS = [
     r"^wrap\d+$",
     r"transcriber'?s?\s*note",
 ]
+_SKIP_RE = re.compile("|".join(f"(?:{p})" for p in SKIP_PATTERNS), re.IGNORECASE)
+
+# Section titles parse_epub treats as front matter
+FRONT_MATTER_PATTERNS = [
+    r"table\s*of\s*contents",
+    r"^contents$",
+    r"copyright",
+    r"dedication",
+    r"acknowledgments?",
+    r"title\s*page",
+    r"about\s*the\s*author",
+    r"also\s*by",
+    r"^cover$",
+]
+_FRONT_MATTER_RE = re.compile("|".join(f"(?:{p})" for p in FRONT_MATTER_PATTERNS), re.IGNORECASE)
+
+# Applied after whitespace is collapsed, so a single optional space suffices
+_PUNCT_SPACE_RE = re.compile(r" ([.,!?;:])")
+_SENT_RE = re.compile(r"([.!?]) ?([A-Z])")
 
 
 def _should_skip_toc_entry(title: str) -> bool:
     """Check if a ToC entry should be skipped (front/back matter)."""
-    title_lower = title.lower().strip()
-    for pattern in SKIP_PATTERNS:
-        if re.search(pattern, title_lower, re.IGNORECASE):
-            return True
-    return False
+    return bool(_SKIP_RE.search(title.strip()))
+
 
+def _toc_entry(title: Optional[str], href: str) -> tuple[str, str, str]:
+    """Split a ToC href ("file.xhtml#anchor") into a (title, file_path, anchor) record."""
+    file_path, _, anchor = href.partition("#")
+    return title or "", unquote(file_path), anchor
 
-def _flatten_toc(toc: list) -> list[tuple[str, str]]:
-    """Flatten nested ToC structure into list of (title, href) tuples."""
+
+def _read_ncx_toc(data: bytes) -> list[tuple[str, str, str]]:
+    """Flatten an EPUB 2 NCX navMap into (title, file_path, anchor) tuples in reading order."""
+    root = etree.fromstring(data, _XML_PARSER)
+    nav_map = root.find("ncx:navMap", _NS) if root is not None else None
+    if nav_map is None:
+        return []
+    
     result = []
+    # iter() walks nested navPoints depth-first, i.e. in reading order
+    for point in nav_map.iter(f"{{{_NS['ncx']}}}navPoint"):
+        content = point.find("ncx:content", _NS)
+        result.append(_toc_entry(
+            point.findtext("ncx:navLabel/ncx:text", namespaces=_NS),
+            content.get("src", "") if content is not None else "",
+        ))
+    return result
+
+
+def _read_nav_toc(data: bytes, base_dir: str) -> list[tuple[str, str, str]]:
+    """Flatten an EPUB 3 nav document's toc list into (title, file_path, anchor) tuples.
     
-    for item in toc:
-        if isinstance(item, tuple):
-            # Nested section: (Link, [children])
-            section, children = item
-            if hasattr(section, 'title') and hasattr(section, 'href'):
-                result.append((section.title, section.href))
-            # Recursively process children
-            if isinstance(children, list):
-                result.extend(_flatten_toc(children))
-        elif hasattr(item, 'title') and hasattr(item, 'href'):
-            # Simple Link object
-            result.append((item.title, item.href))
+    Nav hrefs are relative to the nav document, so they are rebased onto
+    base_dir (its directory relative to the OPF) to match document names.
+    """
+    # Nav documents are XHTML, so the XML parser suffices; {*} matches the
+    # element in any (or no) namespace, and epub:type="toc" is matched by value
+    root = etree.fromstring(data, _XML_PARSER)
+    toc_nav = None
+    if root is not None:
+        toc_nav = next((nav for nav in root.iter("{*}nav") if "toc" in nav.attrib.values()), None)
+    top = toc_nav.find("{*}ol") if toc_nav is not None else None
+    if top is None:
+        return []
     
+    result = []
+    # Explicit stack of list iterators: depth-first, in reading order
+    stack = [iter(top.iterfind("{*}li"))]
+    while stack:
+        for li in stack[-1]:
+            sublist = li.find("{*}ol")
+            link = li.find("{*}a")
+            href = link.get("href") if link is not None else None
+            if href:
+                label = li[0] if sublist is not None else link
+                result.append(_toc_entry(
+                    "".join(label.itertext()),
+                    posixpath.normpath(posixpath.join(base_dir, href)),
+                ))
+            if sublist is not None:
+                stack.append(iter(sublist.iterfind("{*}li")))
+                break
+        else:
+            stack.pop()
     return result
 
 
-def _extract_content_from_anchor(soup: BeautifulSoup, anchor_id: str, next_anchor_id: Optional[str] = None) -> str:
+def _parse_body(content: str) -> BeautifulSoup:
+    """Parse the <body> of an ePub document."""
+    # ePub documents are XHTML, which we deliberately parse as (lenient) HTML;
+    # bs4 warns about that, so silence it here rather than process-wide
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", XMLParsedAsHTMLWarning)
+        return BeautifulSoup(content, _PARSER, parse_only=_CONTENT_STRAINER)
+
+
+def _index_ids(soup: BeautifulSoup) -> dict[str, list[Tag]]:
+    """Map each id in the document to its elements in document order, in one traversal."""
+    ids: dict[str, list[Tag]] = {}
+    for tag in soup.find_all(id=True):
+        ids.setdefault(tag["id"], []).append(tag)
+    return ids
+
+
+def _extract_content_from_anchor(
+    ids: dict[str, list[Tag]], anchor_id: str, next_anchor_id: Optional[str] = None
+) -> tuple[str, str]:
     """Extract text content starting from anchor_id until next_anchor_id (or end).
     
     Args:
-        soup: Parsed HTML document
+        ids: Id index of the parsed HTML document (see _index_ids)
         anchor_id: Starting anchor ID (without #)
         next_anchor_id: Ending anchor ID (without #), or None for end of document
         
     Returns:
-        Extracted text content
+        Extracted text content, and the same span cleaned for audio
+        (as clean_text(..., exclude_headings=True))
     """
-    start_elem = soup.find(id=anchor_id)
-    if not start_elem:
-        return ""
-    
-    # Collect text from start element until we hit the next anchor
-    texts = []
-    
-    # Include the start element's text
-    texts.append(start_elem.get_text(separator=" "))
-    
-    # Walk through siblings after the start element
+    if anchor_id not in ids:
+        return "", ""
+    start_elem = ids[anchor_id][0]
+    
+    # The walk stops at the sibling holding the next anchor; that is the
+    # anchor itself or one of its ancestors, so no subtree search is needed
+    boundary: set[int] = set()
+    if next_anchor_id:
+        for node in ids.get(next_anchor_id, ()):
+            while node is not None and id(node) not in boundary:
+                boundary.add(id(node))
+                node = node.parent
+    
+    # The span is the start element plus its siblings up to the next anchor
+    span = [start_elem]
     for sibling in start_elem.find_next_siblings():
-        # Stop if we hit the next chapter anchor
-        if next_anchor_id and sibling.get('id') == next_anchor_id:
+        # Stop if we hit the next chapter anchor, or a sibling containing it
+        if id(sibling) in boundary:
             break
-        # Also check if next anchor is inside this sibling
-        if next_anchor_id:
-            nested = sibling.find(id=next_anchor_id)
-            if nested:
-                # Get text before the nested anchor
-                break
-        texts.append(sibling.get_text(separator=" "))
+        span.append(sibling)
+    
+    text = " ".join(elem.get_text(separator=" ") for elem in span)
+    audio_skip = _NON_CONTENT_TAGS | _HEADING_TAGS
+    audio_text = " ".join(
+        chunk
+        for elem in span
+        if elem.name not in audio_skip
+        for chunk in _iter_text(elem, audio_skip)
+    )
     
-    text = " ".join(texts)
-    # Clean up whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    # Collapse whitespace (split() also strips the ends)
+    return " ".join(text.split()), _normalize_text(audio_text)
+
+
+def _iter_text(node: Tag, skip_tags: frozenset[str]) -> Iterator[str]:
+    """Yield the text strings under node, skipping subtrees rooted at skip_tags.
 
+    Equivalent to decomposing those elements and calling get_text(), but
+    leaves the tree intact so one parsed document can be reused.
+    """
+    stack = [iter(node.contents)]
+    while stack:
+        for child in stack[-1]:
+            if type(child) in _TEXT_TYPES:
+                yield child
+            elif isinstance(child, Tag) and child.name not in skip_tags:
+                stack.append(iter(child.contents))
+                break
+        else:
+            stack.pop()
 
-def clean_text(html_content: str, exclude_headings: bool = False) -> str:
+
+def clean_text(html_content: Union[str, Tag], exclude_headings: bool = False) -> str:
     """Extract and clean text from HTML content.
     
     Args:
-        html_content: Raw HTML content
+        html_content: Raw HTML content, or an already parsed document (left unmodified)
         exclude_headings: If True, remove H1-H6 headings from output
         
     Returns:
         Cleaned text content
     """
-    soup = BeautifulSoup(html_content, "html.parser")
-    
-    # Remove script and style elements
-    for element in soup(["script", "style", "nav", "header", "footer"]):
-        element.decompose()
+    if isinstance(html_content, str):
+        soup = _parse_body(html_content)
+    else:
+        soup = html_content
     
-    # Remove headings if requested (for audio - we don't want to read "Chapter 1" etc)
-    if exclude_headings:
-        for element in soup(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            element.decompose()
+    # Skip script and style elements, and headings if requested
+    # (for audio - we don't want to read "Chapter 1" etc)
+    skip_tags = _NON_CONTENT_TAGS | _HEADING_TAGS if exclude_headings else _NON_CONTENT_TAGS
     
     # Get text and clean it up
-    text = soup.get_text(separator=" ")
-    
-    # Clean up whitespace
-    text = re.sub(r"\s+", " ", text)
-    text = text.strip()
+    return _normalize_text(" ".join(_iter_text(soup, skip_tags)))
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace and fix spacing around punctuation."""
+    # Collapse whitespace (split() also strips the ends)
+    text = " ".join(text.split())
     
     # Clean up common issues
-    text = re.sub(r"\s+([.,!?;:])", r"\1", text)  # Remove space before punctuation
-    text = re.sub(r"([.!?])\s*([A-Z])", r"\1 \2", text)  # Ensure space after sentence
+    text = _PUNCT_SPACE_RE.sub(r"\1", text)  # Remove space before punctuation
+    text = _SENT_RE.sub(r"\1 \2", text)  # Ensure space after sentence
     
     return text
 
 
-def extract_section_title(content: str, fallback_name: str) -> str:
-    """Extract section title from content."""
-    soup = BeautifulSoup(content, "html.parser")
+def extract_section_title(content: Union[str, Tag], fallback_name: str) -> str:
+    """Extract section title from content (raw HTML or an already parsed document)."""
+    soup = _parse_body(content) if isinstance(content, str) else content
     
     # Try to find a heading
     for tag in ["h1", "h2", "h3", "title"]:
@@ -169,6 +317,66 @@ def extract_section_title(content: str, fallback_name: str) -> str:
     return fallback_name.replace(".xhtml", "").replace(".html", "").replace("_", " ").title()
 
 
+def _count_words(text: str) -> int:
+    """Count words in text already normalized by clean_text (single spaces, stripped)."""
+    return text.count(" ") + 1 if text else 0
+
+
+def _read_document(zf: zipfile.ZipFile, zip_name: str) -> str:
+    """Read and decode a document from the archive ("" if it is missing)."""
+    try:
+        return zf.read(zip_name).decode("utf-8", errors="ignore")
+    except KeyError:
+        # Listed in the manifest but missing from the archive
+        return ""
+
+
+def _toc_section_texts(
+    content: str, spans: list[tuple[str, Optional[str]]]
+) -> list[tuple[str, str]]:
+    """Extract the text of each (anchor, next_anchor) span of one document.
+    
+    An empty anchor means the whole document. Each span yields its text with
+    and without headings. Runs in a worker process for large books, so it
+    takes and returns plain strings only.
+    """
+    soup = _parse_body(content)
+    ids = None
+    texts = []
+    for anchor, next_anchor in spans:
+        if anchor:
+            if ids is None:
+                ids = _index_ids(soup)
+            texts.append(_extract_content_from_anchor(ids, anchor, next_anchor))
+        else:
+            texts.append((clean_text(soup), clean_text(soup, exclude_headings=True)))
+    return texts
+
+
+def _document_text_and_title(content: str, name: str) -> tuple[str, str, str]:
+    """Extract a whole document's text, text without headings and title (file-based fallback)."""
+    soup = _parse_body(content)
+    return (
+        clean_text(soup),
+        clean_text(soup, exclude_headings=True),
+        extract_section_title(soup, name),
+    )
+
+
+def _map_documents(fn: Callable[..., T], *args: list) -> list[T]:
+    """map() over per-document jobs, using a process pool when there are enough of them."""
+    count = len(args[0])
+    workers = min(os.cpu_count() or 1, count)
+    if count >= _PARALLEL_MIN_DOCUMENTS and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(fn, *args, chunksize=max(1, count // (workers * 4))))
+        except (OSError, BrokenProcessPool):
+            # No usable process pool here (e.g. a sandbox); parse serially
+            pass
+    return list(map(fn, *args))
+
+
 def parse_epub_sections(epub_path: Path) -> ParsedEpub:
     """Parse an ePub file using ToC for proper chapter detection.
     
@@ -181,114 +389,133 @@ def parse_epub_sections(epub_path: Path) -> ParsedEpub:
     Returns:
         ParsedEpub with all sections listed
     """
-    book = epub.read_epub(str(epub_path))
+    # Only the container, the OPF, the ToC and the documents actually used
+    # are read; images, fonts and stylesheets are never inflated
+    with zipfile.ZipFile(epub_path) as zf:
+        return _parse_epub_archive(zf, epub_path)
+
+
+def _parse_epub_archive(zf: zipfile.ZipFile, epub_path: Path) -> ParsedEpub:
+    """Body of parse_epub_sections, reading from an open ePub archive."""
+    container = etree.fromstring(zf.read("META-INF/container.xml"), _XML_PARSER)
+    opf_path = container.xpath(
+        "//container:rootfile[@media-type='application/oebps-package+xml']/@full-path",
+        namespaces=_NS,
+    )[0]
+    opf_dir = posixpath.dirname(opf_path)
+    package = etree.fromstring(zf.read(opf_path), _XML_PARSER)
     
     # Extract metadata
-    title = book.get_metadata("DC", "title")
-    title = title[0][0] if title else epub_path.stem
-    
-    author = book.get_metadata("DC", "creator")
-    author = author[0][0] if author else "Unknown Author"
-    
-    description = book.get_metadata("DC", "description")
-    description = description[0][0] if description else ""
-    
-    # Try to extract cover image
-    cover_data = None
+    title = package.findtext("opf:metadata/dc:title", namespaces=_NS) or epub_path.stem
+    author = package.findtext("opf:metadata/dc:creator", namespaces=_NS) or "Unknown Author"
+    description = package.findtext("opf:metadata/dc:description", namespaces=_NS) or ""
+    
+    # Walk the manifest once; item names are relative to the OPF directory
+    documents: dict[str, str] = {}  # name -> zip entry (content documents only)
+    items_by_id: dict[str, str] = {}
+    images_by_id: dict[str, str] = {}
+    nav_name = None
+    nav_zip_name = None
+    cover_name = None
+    named_cover = None  # first image named like a cover, if none is declared
+    for item in package.iterfind("opf:manifest/opf:item", _NS):
+        name = unquote(item.get("href", ""))
+        media_type = item.get("media-type", "")
+        properties = item.get("properties", "").split()
+        items_by_id[item.get("id", "")] = name
+        if media_type == _XHTML_MEDIA_TYPE:
+            zip_name = posixpath.normpath(posixpath.join(opf_dir, name))
+            if "nav" not in properties:
+                documents[name] = zip_name
+            elif nav_name is None:
+                # The nav document is the ToC, not book content
+                nav_name, nav_zip_name = name, zip_name
+        elif media_type.startswith("image/"):
+            images_by_id[item.get("id", "")] = name
+            if "cover-image" in properties and cover_name is None:
+                cover_name = name
+            elif named_cover is None and _COVER_NAME_RE.search(name):
+                named_cover = name
+    
+    # EPUB 3 cover-image, then the EPUB 2 <meta name="cover"> manifest id,
+    # then any image named like a cover
+    cover_meta = package.find("opf:metadata/opf:meta[@name='cover']", _NS)
+    if cover_name is None and cover_meta is not None:
+        cover_name = images_by_id.get(cover_meta.get("content", ""))
+    cover_name = cover_name or named_cover
+    cover_zip_name = None
     cover_extension = "jpg"
-    for item in book.get_items():
-        if item.get_type() == ebooklib.ITEM_COVER:
-            cover_data = item.get_content()
-            name = item.get_name().lower()
-            if ".png" in name:
-                cover_extension = "png"
-            break
-    
-    # If no cover item, look for cover image
-    if not cover_data:
-        for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
-            name = item.get_name().lower()
-            if "cover" in name:
-                cover_data = item.get_content()
-                if ".png" in name:
-                    cover_extension = "png"
-                break
-    
-    # Build a cache of documents by name
-    documents: dict[str, tuple[str, BeautifulSoup]] = {}
-    for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-        item_name = item.get_name()
-        content = item.get_content().decode("utf-8", errors="ignore")
-        soup = BeautifulSoup(content, "html.parser")
-        documents[item_name] = (content, soup)
+    if cover_name:
+        cover_zip_name = posixpath.normpath(posixpath.join(opf_dir, cover_name))
+        if cover_name.lower().endswith(".png"):
+            cover_extension = "png"
+    
+    # Prefer the EPUB 3 nav document, then the NCX the spine points at
+    toc_entries: list[tuple[str, str, str]] = []
+    try:
+        if nav_name:
+            toc_entries = _read_nav_toc(zf.read(nav_zip_name), posixpath.dirname(nav_name))
+        ncx_name = items_by_id.get(package.find("opf:spine", _NS).get("toc", ""))
+        if not toc_entries and ncx_name:
+            toc_entries = _read_ncx_toc(zf.read(posixpath.normpath(posixpath.join(opf_dir, ncx_name))))
+    except (KeyError, AttributeError):
+        # Missing ToC file or spine; fall back to file-based sections
+        pass
+    
+    # Documents are read only when needed, so files the ToC never points at
+    # are never inflated or parsed
+    
+    # ToC hrefs may be relative to a different directory than the item
+    # names, so fall back to a basename index (first document wins)
+    documents_by_basename: dict[str, str] = {}
+    for doc_name, zip_name in documents.items():
+        documents_by_basename.setdefault(doc_name.rsplit("/", 1)[-1], zip_name)
     
     # Try ToC-based parsing first
     sections: list[Section] = []
-    toc_entries = _flatten_toc(book.toc)
     
     if toc_entries:
         # Group ToC entries by file
-        entries_by_file: dict[str, list[tuple[int, str, str]]] = {}
-        for idx, (entry_title, href) in enumerate(toc_entries):
-            # Parse href: "file.xhtml#anchor" or just "file.xhtml"
-            if "#" in href:
-                file_path, anchor = href.split("#", 1)
-            else:
-                file_path, anchor = href, ""
-            
-            # URL decode the file path
-            file_path = unquote(file_path)
-            
-            if file_path not in entries_by_file:
-                entries_by_file[file_path] = []
-            entries_by_file[file_path].append((idx, entry_title, anchor))
+        entries_by_file: defaultdict[str, list[tuple[int, str]]] = defaultdict(list)
+        for idx, (_, file_path, anchor) in enumerate(toc_entries):
+            entries_by_file[file_path].append((idx, anchor))
         
-        # Process each ToC entry
-        section_idx = 0
-        for toc_idx, (entry_title, href) in enumerate(toc_entries):
+        # Each entry's section ends at the next ToC anchor in the same file
+        next_anchor_by_idx: dict[int, Optional[str]] = {}
+        for file_entries in entries_by_file.values():
+            for (idx, _), (_, next_anc) in zip(file_entries, file_entries[1:]):
+                next_anchor_by_idx[idx] = next_anc
+        
+        # Resolve each ToC entry to its document, collecting the spans (anchor
+        # up to the next anchor in the same file) to extract from each
+        kept_entries: list[tuple[str, str, str, int]] = []  # title, file_path, zip entry, span index
+        spans_by_doc: dict[str, list[tuple[str, Optional[str]]]] = {}
+        for toc_idx, (entry_title, file_path, anchor) in enumerate(toc_entries):
             # Skip front/back matter
             if _should_skip_toc_entry(entry_title):
                 continue
             
-            # Parse href
-            if "#" in href:
-                file_path, anchor = href.split("#", 1)
-            else:
-                file_path, anchor = href, ""
-            
-            file_path = unquote(file_path)
-            
-            # Find the document
-            doc_item = None
-            raw_content = ""
-            soup = None
-            
-            for doc_name, (content, doc_soup) in documents.items():
-                # Match by exact name or by basename
-                if doc_name == file_path or doc_name.endswith(file_path) or file_path.endswith(doc_name.split("/")[-1]):
-                    raw_content = content
-                    soup = doc_soup
-                    break
-            
-            if not soup:
+            # Find the document by exact name, then by basename
+            zip_name = documents.get(file_path) or documents_by_basename.get(file_path.rsplit("/", 1)[-1])
+            if zip_name is None:
                 continue
             
-            # Find the next anchor in the same file (to know where this section ends)
-            next_anchor = None
-            file_entries = entries_by_file.get(file_path, [])
-            for i, (idx, _, anc) in enumerate(file_entries):
-                if idx == toc_idx and i + 1 < len(file_entries):
-                    next_anchor = file_entries[i + 1][2]
-                    break
-            
-            # Extract content
-            if anchor:
-                text_content = _extract_content_from_anchor(soup, anchor, next_anchor)
-            else:
-                # No anchor - get full document text
-                text_content = clean_text(raw_content, exclude_headings=False)
-            
-            word_count = len(text_content.split()) if text_content else 0
+            spans = spans_by_doc.setdefault(zip_name, [])
+            kept_entries.append((entry_title, file_path, zip_name, len(spans)))
+            spans.append((anchor, next_anchor_by_idx.get(toc_idx)))
+        
+        # Parse each needed document once (in parallel for large books)
+        doc_names = list(spans_by_doc)
+        texts_by_doc = dict(zip(doc_names, _map_documents(
+            _toc_section_texts,
+            [_read_document(zf, zip_name) for zip_name in doc_names],
+            [spans_by_doc[zip_name] for zip_name in doc_names],
+        )))
+        
+        section_idx = 0
+        for entry_title, file_path, zip_name, span_idx in kept_entries:
+            text_content, text_no_headings = texts_by_doc[zip_name][span_idx]
+            word_count = _count_words(text_content)
             
             # Skip empty sections
             if word_count < 10:
@@ -301,25 +528,24 @@ def parse_epub_sections(epub_path: Path) -> ParsedEpub:
                 title=entry_title,
                 word_count=word_count,
                 text_content=text_content,
-                raw_html=raw_content,
+                text_content_no_headings=text_no_headings,
             )
             sections.append(section)
     
     # Fallback to file-based parsing if ToC didn't produce sections
     if not sections:
-        for idx, item in enumerate(book.get_items_of_type(ebooklib.ITEM_DOCUMENT), start=1):
-            content = item.get_content().decode("utf-8", errors="ignore")
-            text_content = clean_text(content, exclude_headings=False)
-            
-            # Get the file name
-            name = item.get_name()
-            if "/" in name:
-                name = name.split("/")[-1]
-            
-            # Extract title
-            section_title = extract_section_title(content, name)
-            
-            word_count = len(text_content.split()) if text_content else 0
+        # File names without their directory
+        names = [name.rsplit("/", 1)[-1] for name in documents]
+        extracted = _map_documents(
+            _document_text_and_title,
+            [_read_document(zf, zip_name) for zip_name in documents.values()],
+            names,
+        )
+        
+        for idx, (name, (text_content, text_no_headings, section_title)) in enumerate(
+            zip(names, extracted), start=1
+        ):
+            word_count = _count_words(text_content)
             
             section = Section(
                 index=idx,
@@ -327,7 +553,7 @@ def parse_epub_sections(epub_path: Path) -> ParsedEpub:
                 title=section_title,
                 word_count=word_count,
                 text_content=text_content,
-                raw_html=content,
+                text_content_no_headings=text_no_headings,
             )
             sections.append(section)
     
@@ -336,11 +562,49 @@ def parse_epub_sections(epub_path: Path) -> ParsedEpub:
         author=author,
         description=description,
         sections=sections,
-        cover_data=cover_data,
+        epub_path=epub_path,
+        cover_zip_name=cover_zip_name,
         cover_extension=cover_extension,
     )
 
 
+def load_epub_sections(epub_path: Path, use_cache: bool = True) -> ParsedEpub:
+    """parse_epub_sections with an on-disk cache for repeated runs on the same file.
+    
+    The cache only holds plain section data (no parse trees). An unreadable
+    or unwritable cache entry just falls back to parsing.
+    """
+    if not use_cache:
+        return parse_epub_sections(epub_path)
+    
+    resolved = epub_path.resolve()
+    st = resolved.stat()
+    key = hashlib.sha1(
+        f"{_EPUB_CACHE_VERSION}:{resolved}:{st.st_mtime_ns}:{st.st_size}".encode()
+    ).hexdigest()
+    cache_path = EPUB_CACHE_DIR / f"{key}.pkl"
+    
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+    
+    parsed = parse_epub_sections(epub_path)
+    
+    try:
+        EPUB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a concurrent run never reads a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=EPUB_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    
+    return parsed
+
+
 def sections_to_chapters(
     sections: list[Section],
     selected_indices: list[int],
@@ -358,14 +622,15 @@ def sections_to_chapters(
     """
     chapters: list[Chapter] = []
     chapter_num = 0
+    selected = frozenset(selected_indices)
     
     for section in sections:
-        if section.index in selected_indices:
+        if section.index in selected:
             chapter_num += 1
             
-            # Re-extract text without headings for audio
+            # Headings are left out of the audio by default
             if exclude_headings:
-                text_content = clean_text(section.raw_html, exclude_headings=True)
+                text_content = section.text_content_no_headings
             else:
                 text_content = section.text_content
             
@@ -384,42 +649,22 @@ def sections_to_chapters(
 
 
 # Keep the old function for backward compatibility
-def parse_epub(epub_path: Path) -> ParsedEpub:
+def parse_epub(epub_path: Path, use_cache: bool = True) -> ParsedEpub:
     """Parse an ePub file (backward compatible - auto-filters sections).
     
     For more control, use parse_epub_sections() instead.
     """
-    parsed = parse_epub_sections(epub_path)
+    parsed = load_epub_sections(epub_path, use_cache=use_cache)
     
     # Auto-select sections that look like content (not front/back matter)
-    front_matter_patterns = [
-        r"table\s*of\s*contents",
-        r"^contents$",
-        r"copyright",
-        r"dedication",
-        r"acknowledgments?",
-        r"title\s*page",
-        r"about\s*the\s*author",
-        r"also\s*by",
-        r"^cover$",
-    ]
-    
     selected = []
     for section in parsed.sections:
-        title_lower = section.title.lower()
-        
         # Skip very short sections
         if section.word_count < 100:
             continue
         
         # Skip front matter
-        is_front_matter = False
-        for pattern in front_matter_patterns:
-            if re.search(pattern, title_lower, re.IGNORECASE):
-                is_front_matter = True
-                break
-        
-        if not is_front_matter:
+        if not _FRONT_MATTER_RE.search(section.title):
             selected.append(section.index)
     
     parsed.chapters = sections_to_chapters(parsed.sections, selected, exclude_headings=True)
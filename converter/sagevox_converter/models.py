@@ -2,11 +2,24 @@
 
 from dataclasses import dataclass, field
 from typing import Optional
+import hashlib
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install sagevox-converter[speedups])
+    orjson = None
 
-@dataclass
+from .storage import write_if_changed
+
+
+def hash_text(text: str) -> str:
+    """Stable digest of chapter text, used to tell whether existing audio is current."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
 class Chapter:
     """Represents a single chapter in a book."""
     number: int
@@ -15,18 +28,22 @@ class Chapter:
     audio_file: Optional[str] = None
     transcript_file: Optional[str] = None  # JSON with word-level timestamps
     duration_seconds: float = 0.0
+    content_hash: Optional[str] = None  # hash_text() of the text the audio was made from
     
     def to_dict(self) -> dict:
+        # Written out by hand rather than asdict(): text_content is never
+        # persisted and asdict() would deep-copy it on every save
         return {
             "number": self.number,
             "title": self.title,
             "audio_file": self.audio_file,
             "transcript_file": self.transcript_file,
             "duration_seconds": round(self.duration_seconds, 2),
+            "content_hash": self.content_hash,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BookMetadata:
     """Metadata for a converted audiobook."""
     id: str
@@ -55,16 +72,21 @@ class BookMetadata:
         }
     
     def save(self, output_dir: Path) -> None:
-        """Save metadata to JSON file."""
-        metadata_path = output_dir / "metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        """Save metadata to JSON file (skipped if the file is unchanged)."""
+        if orjson is not None:
+            data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+        write_if_changed(output_dir / "metadata.json", data)
     
     @classmethod
     def load(cls, metadata_path: Path) -> "BookMetadata":
         """Load metadata from JSON file."""
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(metadata_path.read_bytes())
+        else:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         
         chapters = [
             Chapter(
@@ -74,6 +96,7 @@ class BookMetadata:
                 audio_file=ch.get("audio_file"),
                 transcript_file=ch.get("transcript_file"),
                 duration_seconds=ch.get("duration_seconds", 0.0),
+                content_hash=ch.get("content_hash"),
             )
             for ch in data.get("chapters", [])
         ]
@@ -0,0 +1,63 @@
+"""Filesystem helpers for writing converter output."""
+
+import os
+import shutil
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Optional
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write ``data`` to ``path`` unless the file already holds it.
+
+    Returns True if the file was written.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return True
+
+
+def _file_crc32(path: Path, expected_size: int) -> Optional[int]:
+    """CRC-32 of a file, or None if it is missing or not ``expected_size`` bytes."""
+    try:
+        if path.stat().st_size != expected_size:
+            return None
+        crc = 0
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                crc = zlib.crc32(chunk, crc)
+        return crc
+    except FileNotFoundError:
+        return None
+
+
+def copy_zip_entry_if_changed(zip_path: Path, entry_name: str, path: Path) -> bool:
+    """Stream a zip entry to ``path`` unless the file already holds the same bytes.
+
+    The size and CRC-32 recorded in the zip directory are compared with the
+    existing file, so the entry is only decompressed when it needs writing.
+    Returns True if the file was written.
+    """
+    with zipfile.ZipFile(zip_path) as zf:
+        info = zf.getinfo(entry_name)
+        if _file_crc32(path, info.file_size) == info.CRC:
+            return False
+
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with zf.open(info) as src, open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+            dst.flush()
+            os.fsync(dst.fileno())
+    os.replace(tmp_path, path)
+    return True
@@ -1,22 +1,69 @@
 """Gemini TTS service for audiobook generation with sentence-level timestamps."""
 
+from __future__ import annotations
+
 import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
 import wave
 import json
 import base64
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from dataclasses import dataclass
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install sagevox-converter[speedups])
+    orjson = None
 
 from .models import Chapter
+from .voices import AVAILABLE_VOICES, DEFAULT_MAX_CONCURRENT, DEFAULT_RPM, DEFAULT_SERVICE_TIER, DEFAULT_TPM
 
 
 # Maximum characters per TTS request
 MAX_CHUNK_CHARS = 4000
 
+TTS_MODEL = "gemini-2.5-flash-preview-tts"
+
+# Synthesized chunk audio is cached here, keyed by everything that shapes it
+TTS_CACHE_DIR = Path.home() / ".cache" / "sagevox" / "tts"
+
+# Older google-genai releases have no service_tier option; they get the default tier
+_SERVICE_TIER_SUPPORTED = "service_tier" in types.GenerateContentConfig.model_fields
+
+# Inlined batch requests arrived in google-genai 1.22; older releases can't use batch mode
+BATCH_SUPPORTED = hasattr(types, "InlinedRequest")
+
+# Sentence boundaries: whitespace after terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Chapter batches at least this large are split on a process pool;
+# for smaller ones worker start-up costs more than it saves
+_PARALLEL_MIN_CHAPTERS = 16
+
+
 # Narrator style presets for different audiobook experiences
 NARRATOR_STYLES = {
     "classic": """# AUDIO PROFILE: The Classic Narrator
@@ -96,6 +143,24 @@ You love this story and want to share that excitement. Keep
 listeners on the edge of their seats with your infectious energy.""",
 }
 
+# Each preset with its separator, so first chunks don't rebuild the prefix
+_STYLE_PREFIXES = {prompt: f"{prompt}\n\n" for prompt in NARRATOR_STYLES.values()}
+
+
+def _resolve_style_prompt(style_prompt: Optional[str], narrator_style: str) -> str:
+    """Custom style prompt takes precedence, then the preset, then the classic preset."""
+    if style_prompt is not None:
+        return style_prompt
+    return NARRATOR_STYLES.get(narrator_style, NARRATOR_STYLES["classic"])
+
+
+@dataclass(slots=True)
+class ChunkPlan:
+    """One TTS request's worth of a chapter: its sentences and the text sent."""
+    sentences: list[str]
+    lengths: list[int]
+    text: str
+
 
 @dataclass
 class Segment:
@@ -127,89 +192,344 @@ class TranscriptData:
         }
     
     def save(self, path: Path) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+class RateLimiter:
+    """Thread-safe token bucket for requests-per-minute and tokens-per-minute quotas.
+
+    Each bucket holds up to one minute of quota and refills continuously, so
+    concurrent workers are paced instead of bursting into 429s.
+    """
+
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        # Set after a 429 so every worker backs off, not just the one that hit it
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request and ``tokens`` tokens are available, then take them."""
+        # A single request larger than the whole budget would otherwise wait forever
+        tokens = min(tokens, self.tpm)
+        with self._cond:
+            while True:
+                paused = self._paused_until - time.monotonic()
+                if paused > 0:
+                    self._cond.wait(timeout=paused)
+                    continue
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self._requests) * 60 / self.rpm,
+                    (tokens - self._tokens) * 60 / self.tpm,
+                )
+                self._cond.wait(timeout=wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all acquirers for ``seconds`` (extending any pause already in effect)."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def refund(self, tokens: int) -> None:
+        """Return over-estimated tokens to the bucket (negative values charge extra)."""
+        with self._cond:
+            self._refill()
+            self._tokens = min(self.tpm, self._tokens + tokens)
+            self._cond.notify_all()
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    return isinstance(exc, errors.APIError) and exc.code == 429
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Rate limits and server-side errors are transient; other API errors are not."""
+    return isinstance(exc, errors.APIError) and (exc.code == 429 or (exc.code or 0) >= 500)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """The delay the server asked for, from Retry-After or the error's RetryInfo."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers and headers.get("retry-after", "").isdigit():
+        return float(headers["retry-after"])
+    details = getattr(exc, "details", None)
+    if isinstance(details, dict):
+        for detail in details.get("error", {}).get("details", []):
+            delay = detail.get("retryDelay", "") if isinstance(detail, dict) else ""
+            if delay.endswith("s"):
+                try:
+                    return float(delay[:-1])
+                except ValueError:
+                    pass
+    return None
+
+
+# Jitter keeps workers that failed together from retrying together
+_BACKOFF = wait_exponential(multiplier=2, min=2, max=60) + wait_random(0, 2)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    delay = _retry_after(retry_state.outcome.exception())
+    return delay if delay is not None else _BACKOFF(retry_state)
+
+
+def _backoff_together(retry_state: RetryCallState) -> None:
+    """On a 429, hold every worker sharing the rate limiter for the same delay."""
+    service = retry_state.args[0]
+    if service.rate_limiter and _is_rate_limited(retry_state.outcome.exception()):
+        service.rate_limiter.pause(retry_state.next_action.sleep)
+
+
+# One client per API key for the whole process, so every service instance
+# reuses the same pooled keep-alive HTTP connections
+_CLIENT_CACHE: dict[str, genai.Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _shared_client(api_key: str) -> genai.Client:
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = _CLIENT_CACHE[api_key] = genai.Client(api_key=api_key)
+        return client
+
+
+@lru_cache(maxsize=1)
+def find_mp3_encoder() -> Optional[str]:
+    """Path to an ffmpeg that can encode MP3 (libmp3lame), or None.
+    
+    Probed once per process; call it up front to warn about a missing encoder.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if not ffmpeg_path:
+        return None
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return ffmpeg_path if "libmp3lame" in result.stdout else None
+
+
+class _EncoderError(RuntimeError):
+    """ffmpeg failed while encoding a chapter."""
+
+
+class _ChapterAudioWriter:
+    """Encodes a chapter's PCM (24kHz, 16-bit, mono) as it is produced.
+    
+    PCM is piped straight into ffmpeg's stdin and also written to a WAV
+    beside it, so if ffmpeg fails the WAV is kept instead and the chapter
+    never has to be synthesized again. Without a usable ffmpeg only the WAV
+    is written. Either way the audio is written under a temporary name and
+    renamed into place once complete; ``filename`` and ``path`` name the
+    file that was kept and ``encoder_error`` says why, if it is the WAV.
+    """
+    
+    def __init__(self, output_dir: Path, chapter_number: int):
+        ffmpeg_path = find_mp3_encoder()
+        self._proc: Optional[subprocess.Popen] = None
+        self.encoder_error: Optional[_EncoderError] = None
+        
+        stem = f"chapter-{chapter_number:02d}"
+        self._wav_path = output_dir / f"{stem}.wav"
+        self._wav_tmp_path = output_dir / f"{stem}.wav.part"
+        self._mp3_path = output_dir / f"{stem}.mp3"
+        self._mp3_tmp_path = output_dir / f"{stem}.mp3.part"
+        self.path = self._mp3_path if ffmpeg_path else self._wav_path
+        self.filename = self.path.name
+        
+        self._wav = wave.open(os.fspath(self._wav_tmp_path), "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(24000)
+        if ffmpeg_path:
+            self._stderr = tempfile.TemporaryFile()
+            self._proc = subprocess.Popen(
+                [ffmpeg_path, "-y", "-loglevel", "error",
+                 "-f", "s16le", "-ar", "24000", "-ac", "1", "-i", "pipe:0",
+                 "-acodec", "libmp3lame", "-ab", "192k",
+                 "-ar", "24000", "-ac", "1", "-f", "mp3", self._mp3_tmp_path],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._stderr,
+            )
+    
+    def _ffmpeg_error(self) -> _EncoderError:
+        self._proc.wait()
+        self._stderr.seek(0)
+        detail = self._stderr.read().decode("utf-8", errors="replace").strip()
+        return _EncoderError(f"MP3 encoding failed: {detail or f'ffmpeg exited with {self._proc.returncode}'}")
+    
+    def _finish_encoder(self) -> None:
+        """Close ffmpeg's input and wait for it, recording any failure."""
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self._proc.wait() != 0 and self.encoder_error is None:
+            self.encoder_error = self._ffmpeg_error()
+        self._stderr.close()
+    
+    def write(self, pcm: bytes) -> None:
+        self._wav.writeframes(pcm)
+        if self._proc is None or self.encoder_error is not None:
+            return
+        try:
+            self._proc.stdin.write(pcm)
+        except BrokenPipeError:
+            # Keep going with just the WAV
+            self.encoder_error = self._ffmpeg_error()
+    
+    def close(self) -> None:
+        """Finish the file and move it into place, falling back to the WAV if ffmpeg failed."""
+        self._wav.close()
+        if self._proc is not None:
+            self._finish_encoder()
+            if self.encoder_error is None:
+                self._wav_tmp_path.unlink()
+                os.replace(self._mp3_tmp_path, self._mp3_path)
+                # Don't leave older audio in the other format to shadow this one
+                self._wav_path.unlink(missing_ok=True)
+                return
+            self._mp3_tmp_path.unlink(missing_ok=True)
+            self.path = self._wav_path
+            self.filename = self.path.name
+        os.replace(self._wav_tmp_path, self._wav_path)
+        self._mp3_path.unlink(missing_ok=True)
+    
+    def abort(self) -> None:
+        """Stop encoding and remove the partial files."""
+        self._wav.close()
+        self._wav_tmp_path.unlink(missing_ok=True)
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._stderr.close()
+            self._mp3_tmp_path.unlink(missing_ok=True)
+
+
+def _split_into_sentences(text: str) -> Iterator[str]:
+    """Split text into sentences, lazily.
+
+    Sentences are sliced out between boundary matches as they are
+    found, rather than materializing the whole split list up front.
+    """
+    # Split on sentence endings, keeping the punctuation
+    start = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(text):
+        sentence = text[start:match.start()].strip()
+        if sentence:
+            yield sentence
+        start = match.end()
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
+
+
+def _chunk_sentences(sentences: Iterable[str]) -> list[ChunkPlan]:
+    """Group sentences into chunks that fit API limits.
+
+    Each chunk's request text is joined once here, and each sentence keeps
+    the length measured here, so neither is recomputed downstream.
+    """
+    chunks = []
+    current_sentences: list[str] = []
+    current_lengths: list[int] = []
+    current_length = 0
+
+    for sentence in sentences:
+        sentence_len = len(sentence)
+
+        if current_length + sentence_len + 1 > MAX_CHUNK_CHARS:
+            if current_sentences:
+                chunks.append(ChunkPlan(current_sentences, current_lengths, " ".join(current_sentences)))
+            current_sentences = [sentence]
+            current_lengths = [sentence_len]
+            current_length = sentence_len
+        else:
+            current_sentences.append(sentence)
+            current_lengths.append(sentence_len)
+            current_length += sentence_len + 1
+
+    if current_sentences:
+        chunks.append(ChunkPlan(current_sentences, current_lengths, " ".join(current_sentences)))
+
+    return chunks
+
+
+def _plan_chunks(text: str) -> list[ChunkPlan]:
+    return _chunk_sentences(_split_into_sentences(text))
 
 
 class GeminiTTSService:
     """Service for generating audiobook audio using Gemini TTS with API key."""
     
-    AVAILABLE_VOICES = [
-        "Zephyr", "Puck", "Charon", "Kore", "Fenrir", "Aoede",
-        "Leda", "Orus", "Autonoe", "Enceladus", "Iapetus", "Umbriel",
-        "Algieba", "Despina", "Erinome", "Algenib", "Rasalgethi",
-        "Laomedeia", "Achernar", "Alnilam", "Schedar", "Gacrux",
-        "Pulcherrima", "Achird", "Zubenelgenubi", "Vindemiatrix",
-        "Sadachbia", "Sadaltager", "Sulafat",
-    ]
+    AVAILABLE_VOICES = AVAILABLE_VOICES
     
     def __init__(
         self,
         voice: str = "Kore",
         language_code: str = "en-US",
         api_key: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        service_tier: Optional[str] = DEFAULT_SERVICE_TIER,
+        cache_dir: Optional[Path] = None,
     ):
         self.voice = voice
         self.language_code = language_code
+        self.rate_limiter = rate_limiter
+        self.max_concurrent = max(1, max_concurrent)
+        self.service_tier = service_tier
+        # Chunk PCM cache; None disables it
+        self.cache_dir = cache_dir
+        # Chapter number -> why its MP3 encode failed and a WAV was kept.
+        # Filled in by worker threads for the caller to report.
+        self.encoder_errors: dict[int, str] = {}
         
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key required. Set GEMINI_API_KEY environment variable.")
         
-        self.client = genai.Client(api_key=self.api_key)
-    
-    def _split_into_sentences(self, text: str) -> list[str]:
-        """Split text into sentences."""
-        import re
-        # Split on sentence endings, keeping the punctuation
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
-    
-    def _chunk_sentences(self, sentences: list[str]) -> list[list[str]]:
-        """Group sentences into chunks that fit API limits."""
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for sentence in sentences:
-            sentence_len = len(sentence)
-            
-            if current_length + sentence_len + 1 > MAX_CHUNK_CHARS:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = [sentence]
-                current_length = sentence_len
-            else:
-                current_chunk.append(sentence)
-                current_length += sentence_len + 1
-        
-        if current_chunk:
-            chunks.append(current_chunk)
-        
-        return chunks
+        self.client = _shared_client(self.api_key)
     
     # Consistency reminder for subsequent chunks to prevent pacing drift
     CONSISTENCY_REMINDER = """[Continue with the same measured pace, warm tone, and natural breathing as before. Do not speed up. Maintain consistent tempo.]
 
 """
     
-    def _generate_audio(self, text: str, chunk_index: int = 0, style_prompt: str = "") -> bytes:
-        """Generate audio for text chunk.
-        
-        Args:
-            text: The text to synthesize
-            chunk_index: Index of this chunk (0 = first, gets full style prompt)
-            style_prompt: The full narrator style prompt
-        """
+    def _chunk_prompt(self, text: str, chunk_index: int, style_prompt: str) -> str:
+        """Prefix a chunk's text with the narrator direction it should get."""
         if chunk_index == 0 and style_prompt:
             # First chunk gets full style prompt
-            full_text = f"{style_prompt}\n\n{text}"
+            prefix = _STYLE_PREFIXES.get(style_prompt) or f"{style_prompt}\n\n"
+            return prefix + text
         elif chunk_index > 0:
             # Subsequent chunks get consistency reminder
-            full_text = f"{self.CONSISTENCY_REMINDER}{text}"
-        else:
-            full_text = text
-        
+            return f"{self.CONSISTENCY_REMINDER}{text}"
+        return text
+    
+    def _generation_config(self, service_tier: Optional[str] = None) -> types.GenerateContentConfig:
         speech_config = types.SpeechConfig(
             voice_config=types.VoiceConfig(
                 prebuilt_voice_config=types.PrebuiltVoiceConfig(
@@ -217,37 +537,138 @@ class GeminiTTSService:
                 )
             )
         )
+        extra = {"service_tier": service_tier} if service_tier and _SERVICE_TIER_SUPPORTED else {}
+        return types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=speech_config,
+            **extra,
+        )
+    
+    @staticmethod
+    def _response_audio(response: types.GenerateContentResponse) -> bytes:
+        """Concatenate the PCM parts of a TTS response."""
+        parts = response.candidates[0].content.parts if response.candidates else None
+        if not parts:
+            return b""
+        # The SDK hands back bytes; base64 text only comes from raw JSON payloads
+        return b"".join(
+            data if isinstance(data := part.inline_data.data, bytes) else base64.b64decode(data)
+            for part in parts
+            if getattr(part, "inline_data", None)
+        )
+    
+    def _generate_audio(self, text: str, chunk_index: int = 0, style_prompt: str = "") -> bytes:
+        """Generate audio for text chunk.
+        
+        Args:
+            text: The text to synthesize
+            chunk_index: Index of this chunk (0 = first, gets full style prompt)
+            style_prompt: The full narrator style prompt
+        """
+        full_text = self._chunk_prompt(text, chunk_index, style_prompt)
+        audio = self._load_cached(full_text)
+        if audio is not None:
+            return audio
+        
+        response = self._request_audio(full_text, self._generation_config(self.service_tier))
+        audio = self._response_audio(response)
+        self._store_cached(full_text, audio)
+        return audio
+    
+    def _cache_path(self, full_text: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.blake2b(
+            f"{TTS_MODEL}|{self.voice}|{self.language_code}|{full_text}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return self.cache_dir / f"{key}.pcm"
+    
+    def _load_cached(self, full_text: str) -> Optional[bytes]:
+        """Cached PCM for a prompt, or None on a miss (or with the cache off)."""
+        cache_path = self._cache_path(full_text)
+        if cache_path is None:
+            return None
+        try:
+            return cache_path.read_bytes()
+        except OSError:
+            return None
+    
+    def _store_cached(self, full_text: str, audio: bytes) -> None:
+        cache_path = self._cache_path(full_text)
+        if cache_path is None or not audio:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so a concurrent run never reads partial audio
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        wait=_retry_wait,
+        stop=stop_after_attempt(5),
+        before_sleep=_backoff_together,
+        reraise=True,
+    )
+    def _request_audio(self, full_text: str, config: types.GenerateContentConfig):
+        """Call the TTS model, paced by the rate limiter and retried on 429/5xx."""
+        # Rough estimate (~4 chars per token); settled against reported usage below
+        estimated_tokens = len(full_text) // 4
+        if self.rate_limiter:
+            self.rate_limiter.acquire(estimated_tokens)
         
         response = self.client.models.generate_content(
-            model="gemini-2.5-flash-preview-tts",
+            model=TTS_MODEL,
             contents=full_text,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=speech_config,
-            ),
+            config=config,
         )
         
-        audio_data = b""
-        if response.candidates and response.candidates[0].content.parts:
-            for part in response.candidates[0].content.parts:
-                if hasattr(part, 'inline_data') and part.inline_data:
-                    data = part.inline_data.data
-                    if isinstance(data, str):
-                        data = base64.b64decode(data)
-                    audio_data += data
+        usage = getattr(response, "usage_metadata", None)
+        if self.rate_limiter and usage and usage.prompt_token_count is not None:
+            self.rate_limiter.refund(estimated_tokens - usage.prompt_token_count)
         
-        return audio_data
+        return response
     
     def _audio_duration(self, audio_bytes: bytes) -> float:
         """Calculate duration from PCM audio bytes (24kHz, 16-bit, mono)."""
         return len(audio_bytes) / (24000 * 2)
     
+    def prepare_chapter(self, chapter: Chapter) -> list[ChunkPlan]:
+        """Split a chapter into API-sized chunks of sentences.
+        
+        This is pure CPU work, so callers can run it ahead of time while
+        other chapters are waiting on the network.
+        """
+        return _plan_chunks(chapter.text_content)
+    
+    def prepare_chapters(self, chapters: list[Chapter]) -> list[list[ChunkPlan]]:
+        """prepare_chapter for many chapters at once, on a process pool when there are enough.
+        
+        Splitting is pure Python, so threads wouldn't run it in parallel.
+        """
+        texts = [chapter.text_content for chapter in chapters]
+        workers = min(os.cpu_count() or 1, len(texts))
+        if len(texts) >= _PARALLEL_MIN_CHAPTERS and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(_plan_chunks, texts, chunksize=max(1, len(texts) // (workers * 4))))
+            except (OSError, BrokenProcessPool):
+                # No usable process pool here (e.g. a sandbox); split serially
+                pass
+        return list(map(_plan_chunks, texts))
+    
     def synthesize_chapter(
         self,
         chapter: Chapter,
         output_dir: Path,
         style_prompt: Optional[str] = None,
         narrator_style: str = "classic",
+        chunks: Optional[list[ChunkPlan]] = None,
     ) -> tuple[str, float, TranscriptData]:
         """Synthesize audio for a chapter with sentence-level timestamps.
         
@@ -256,94 +677,240 @@ class GeminiTTSService:
             output_dir: Directory to save output files
             style_prompt: Custom style prompt (overrides narrator_style)
             narrator_style: Preset narrator style: "classic", "dramatic", "calm", "energetic"
+            chunks: Output of prepare_chapter, if already computed
         
         Returns:
             Tuple of (audio_filename, duration_seconds, transcript_data)
         """
-        # Resolve style prompt: custom takes precedence, then preset, then default
-        if style_prompt is None:
-            style_prompt = NARRATOR_STYLES.get(narrator_style, NARRATOR_STYLES["classic"])
+        style_prompt = _resolve_style_prompt(style_prompt, narrator_style)
         
-        # Split into sentences
-        sentences = self._split_into_sentences(chapter.text_content)
+        if chunks is None:
+            chunks = self.prepare_chapter(chapter)
         
-        # Group into API-sized chunks
-        chunks = self._chunk_sentences(sentences)
+        # Chunks are requested concurrently, but consumed in order so the
+        # audio and timestamps come out exactly as if generated serially
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrent, len(chunks)))) as pool:
+            pending = self._submit_chunks(pool, chunks, style_prompt)
+            try:
+                return self._write_chapter(
+                    chapter,
+                    output_dir,
+                    chunks,
+                    (pending.popleft().result() for _ in range(len(chunks))),
+                )
+            except BaseException:
+                # Don't keep spending quota on a chapter that has already failed
+                pool.shutdown(cancel_futures=True)
+                raise
+    
+    def _submit_chunks(
+        self,
+        pool: ThreadPoolExecutor,
+        chunks: list[ChunkPlan],
+        style_prompt: str,
+    ) -> deque[Future]:
+        """Submit each distinct chunk once; returns one future per chunk, in order.
         
-        # Track audio and timestamps
-        all_audio = b""
-        segments: list[Segment] = []
-        current_time = 0.0
+        Repeated text (scene breaks, refrains) shares a single request. The
+        first chunk is keyed separately since it carries the style prompt.
+        """
+        unique: dict[tuple[bool, str], Future] = {}
+        pending: deque[Future] = deque()
+        for chunk_idx, plan in enumerate(chunks):
+            key = (chunk_idx == 0, plan.text)
+            future = unique.get(key)
+            if future is None:
+                # First chunk gets full style, subsequent get consistency reminder
+                future = unique[key] = pool.submit(
+                    self._generate_audio,
+                    plan.text,
+                    chunk_index=chunk_idx,
+                    style_prompt=style_prompt,
+                )
+            pending.append(future)
+        return pending
+    
+    def synthesize_chapters_batch(
+        self,
+        chapters: list[Chapter],
+        output_dir: Path,
+        style_prompt: Optional[str] = None,
+        narrator_style: str = "classic",
+        poll_interval: float = 30.0,
+    ) -> Iterator[tuple[Chapter, Future]]:
+        """Synthesize several chapters through a single Gemini batch job.
         
-        for chunk_idx, sentence_group in enumerate(chunks):
-            # Combine sentences for this API call
-            chunk_text = " ".join(sentence_group)
-            
-            # Generate audio (first chunk gets full style, subsequent get consistency reminder)
-            audio_bytes = self._generate_audio(
-                chunk_text, 
-                chunk_index=chunk_idx,
-                style_prompt=style_prompt
-            )
-            
-            chunk_duration = self._audio_duration(audio_bytes)
-            
-            # Estimate timing per sentence based on character length
-            total_chars = sum(len(s) for s in sentence_group)
-            
-            for sentence in sentence_group:
-                # Proportional duration based on character count
-                if total_chars > 0:
-                    sentence_duration = chunk_duration * (len(sentence) / total_chars)
+        Batch jobs are billed at a discount and don't count against the
+        request quota, but finish asynchronously (minutes to hours), so this
+        suits offline conversion of whole books. Every chunk of every chapter
+        that isn't in the audio cache is submitted at once; the rate limiter
+        is not used.
+        
+        Args:
+            chapters: The chapters to synthesize
+            output_dir: Directory to save output files
+            style_prompt: Custom style prompt (overrides narrator_style)
+            narrator_style: Preset narrator style
+            poll_interval: Seconds between job status checks
+        
+        Yields:
+            (chapter, future) pairs as each chapter finishes encoding, once
+            the job is done. Each future is resolved to synthesize_chapter's
+            result, or holds the error for a chapter whose requests failed.
+        """
+        if not BATCH_SUPPORTED:
+            raise RuntimeError("Batch mode needs google-genai 1.22 or newer")
+        style_prompt = _resolve_style_prompt(style_prompt, narrator_style)
+        
+        chapter_chunks = self.prepare_chapters(chapters)
+        chapter_prompts = [
+            [
+                self._chunk_prompt(plan.text, chunk_idx, style_prompt)
+                for chunk_idx, plan in enumerate(chunks)
+            ]
+            for chunks in chapter_chunks
+        ]
+        
+        # Chunks already in the audio cache aren't sent again
+        cached = {
+            prompt
+            for prompts in chapter_prompts
+            for prompt in prompts
+            if (cache_path := self._cache_path(prompt)) is not None and cache_path.exists()
+        }
+        # Each distinct prompt is requested once, however often it repeats
+        request_index: dict[str, int] = {}
+        for prompts in chapter_prompts:
+            for prompt in prompts:
+                if prompt not in cached and prompt not in request_index:
+                    request_index[prompt] = len(request_index)
+        config = self._generation_config()
+        requests = [
+            types.InlinedRequest(model=TTS_MODEL, contents=prompt, config=config)
+            for prompt in request_index
+        ]
+        responses = self._run_batch(requests, poll_interval) if requests else []
+        
+        # All audio is in hand now, so encoding is the only work left; run one
+        # ffmpeg per core instead of encoding the chapters back to back
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = {
+                pool.submit(
+                    self._write_batch_chapter,
+                    chapter,
+                    output_dir,
+                    chunks,
+                    prompts,
+                    cached,
+                    responses,
+                    request_index,
+                ): chapter
+                for chapter, chunks, prompts in zip(chapters, chapter_chunks, chapter_prompts)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future
+    
+    def _write_batch_chapter(
+        self,
+        chapter: Chapter,
+        output_dir: Path,
+        chunks: list[ChunkPlan],
+        prompts: list[str],
+        cached: set[str],
+        responses: list[types.InlinedResponse],
+        request_index: dict[str, int],
+    ) -> tuple[str, float, TranscriptData]:
+        """_write_chapter for one chapter of a batch job."""
+        def chunk_audio() -> Iterator[bytes]:
+            for prompt in prompts:
+                if prompt in cached:
+                    yield self._cache_path(prompt).read_bytes()
                 else:
-                    sentence_duration = chunk_duration / len(sentence_group)
-                
-                segments.append(Segment(
-                    text=sentence,
-                    start=current_time,
-                    end=current_time + sentence_duration,
-                ))
-                current_time += sentence_duration
-            
-            all_audio += audio_bytes
+                    yield self._inlined_audio(prompt, responses[request_index[prompt]])
         
-        # Save audio
-        audio_filename = f"chapter-{chapter.number:02d}.mp3"
-        wav_path = output_dir / f"chapter-{chapter.number:02d}.wav"
-        mp3_path = output_dir / audio_filename
+        return self._write_chapter(chapter, output_dir, chunks, chunk_audio())
+    
+    def _run_batch(
+        self,
+        requests: list[types.InlinedRequest],
+        poll_interval: float,
+    ) -> list[types.InlinedResponse]:
+        """Submit one batch job and wait for its responses."""
+        # Jobs in these states will not change any more
+        done_states = {
+            types.JobState.JOB_STATE_SUCCEEDED,
+            types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+            types.JobState.JOB_STATE_FAILED,
+            types.JobState.JOB_STATE_CANCELLED,
+            types.JobState.JOB_STATE_EXPIRED,
+        }
+        job = self.client.batches.create(
+            model=TTS_MODEL,
+            src=requests,
+            config=types.CreateBatchJobConfig(display_name="sagevox"),
+        )
+        while job.state not in done_states:
+            time.sleep(poll_interval)
+            job = self.client.batches.get(name=job.name)
         
-        with wave.open(str(wav_path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(24000)
-            wf.writeframes(all_audio)
+        responses = job.dest.inlined_responses if job.dest else None
+        if job.state not in (types.JobState.JOB_STATE_SUCCEEDED, types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED):
+            raise RuntimeError(f"Batch job {job.name} ended in {job.state}: {job.error}")
+        if not responses or len(responses) != len(requests):
+            raise RuntimeError(f"Batch job {job.name} returned {len(responses or [])} of {len(requests)} responses")
+        return responses
+    
+    def _inlined_audio(self, full_text: str, inlined: types.InlinedResponse) -> bytes:
+        if inlined.error:
+            raise RuntimeError(f"Batch request failed: {inlined.error.message}")
+        audio = self._response_audio(inlined.response)
+        self._store_cached(full_text, audio)
+        return audio
+    
+    def _write_chapter(
+        self,
+        chapter: Chapter,
+        output_dir: Path,
+        chunks: list[ChunkPlan],
+        chunk_audio: Iterable[bytes],
+    ) -> tuple[str, float, TranscriptData]:
+        """Encode a chapter's audio and build its timestamps.
         
-        total_duration = self._audio_duration(all_audio)
+        ``chunk_audio`` yields each chunk's PCM in order; it is consumed
+        lazily, so only the chunks not yet written are held in memory.
+        """
+        segments: list[Segment] = []
+        current_time = 0.0
+        total_audio_bytes = 0
         
-        # Convert to MP3
+        writer = _ChapterAudioWriter(output_dir, chapter.number)
         try:
-            import subprocess
-            import shutil
-            
-            ffmpeg_path = shutil.which("ffmpeg")
-            if not ffmpeg_path:
-                raise RuntimeError("ffmpeg not found")
-            
-            result = subprocess.run(
-                [ffmpeg_path, "-y", "-i", str(wav_path),
-                 "-acodec", "libmp3lame", "-ab", "192k",
-                 "-ar", "24000", "-ac", "1", str(mp3_path)],
-                capture_output=True, text=True,
-            )
-            if result.returncode == 0:
-                wav_path.unlink()
-            else:
-                raise RuntimeError(result.stderr)
-        except Exception as e:
-            print(f"Warning: MP3 conversion failed ({e}), keeping WAV")
-            audio_filename = f"chapter-{chapter.number:02d}.wav"
-            if wav_path.exists():
-                wav_path.rename(output_dir / audio_filename)
+            for plan, audio_bytes in zip(chunks, chunk_audio):
+                chunk_duration = self._audio_duration(audio_bytes)
+                
+                # Estimate timing per sentence based on character length
+                total_chars = sum(plan.lengths)
+                if total_chars > 0:
+                    durations = [chunk_duration * (length / total_chars) for length in plan.lengths]
+                else:
+                    durations = [chunk_duration / len(plan.sentences)] * len(plan.sentences)
+                
+                # Running sum gives every boundary; each segment spans two neighbours
+                times = list(accumulate(durations, initial=current_time))
+                segments.extend(map(Segment, plan.sentences, times, times[1:]))
+                current_time = times[-1]
+                
+                writer.write(audio_bytes)
+                total_audio_bytes += len(audio_bytes)
+            writer.close()
+        except BaseException:
+            # Never leave truncated audio behind to be mistaken for a finished chapter
+            writer.abort()
+            raise
+        if writer.encoder_error is not None:
+            self.encoder_errors[chapter.number] = str(writer.encoder_error)
+        
+        total_duration = total_audio_bytes / (24000 * 2)
         
         # Create transcript
         transcript = TranscriptData(
@@ -352,4 +919,4 @@ class GeminiTTSService:
             segments=segments,
         )
         
-        return audio_filename, total_duration, transcript
+        return writer.filename, total_duration, transcript
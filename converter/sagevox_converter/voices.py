@@ -0,0 +1,42 @@
+"""Gemini TTS voice catalogue and quota defaults.
+
+Kept free of heavy imports so the CLI can build its options without loading
+the Gemini SDK.
+"""
+
+# Voices accepted by Gemini TTS
+AVAILABLE_VOICES = [
+    "Zephyr", "Puck", "Charon", "Kore", "Fenrir", "Aoede",
+    "Leda", "Orus", "Autonoe", "Enceladus", "Iapetus", "Umbriel",
+    "Algieba", "Despina", "Erinome", "Algenib", "Rasalgethi",
+    "Laomedeia", "Achernar", "Alnilam", "Schedar", "Gacrux",
+    "Pulcherrima", "Achird", "Zubenelgenubi", "Vindemiatrix",
+    "Sadachbia", "Sadaltager", "Sulafat",
+]
+
+# Short description of each voice, as listed by `sagevox-convert voices`
+VOICE_STYLES = {
+    "Kore": "Firm", "Charon": "Informative", "Puck": "Upbeat",
+    "Fenrir": "Excitable", "Aoede": "Breezy", "Leda": "Youthful",
+    "Zephyr": "Bright", "Orus": "Firm", "Autonoe": "Bright",
+    "Enceladus": "Breathy", "Iapetus": "Clear", "Umbriel": "Easy-going",
+    "Algieba": "Smooth", "Despina": "Smooth", "Erinome": "Clear",
+    "Algenib": "Gravelly", "Rasalgethi": "Informative",
+    "Laomedeia": "Upbeat", "Achernar": "Soft", "Alnilam": "Firm",
+    "Schedar": "Even", "Gacrux": "Mature", "Pulcherrima": "Forward",
+    "Achird": "Friendly", "Zubenelgenubi": "Casual",
+    "Vindemiatrix": "Gentle", "Sadachbia": "Lively",
+    "Sadaltager": "Knowledgeable", "Sulafat": "Warm",
+}
+
+# Gemini TTS Tier-1 quotas
+DEFAULT_RPM = 10
+DEFAULT_TPM = 10000
+
+# TTS requests in flight per chapter (the rate limiter still paces them)
+DEFAULT_MAX_CONCURRENT = 4
+
+# Gemini service tiers; flex is half price with best-effort scheduling,
+# which suits offline conversion
+SERVICE_TIERS = ["flex", "standard", "priority"]
+DEFAULT_SERVICE_TIER = "flex"
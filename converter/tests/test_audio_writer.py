@@ -0,0 +1,91 @@
+"""Tests for chapter audio encoding and its WAV fallback."""
+
+import os
+import wave
+from pathlib import Path
+
+import pytest
+
+from sagevox_converter import tts_service
+
+PCM = b"\x01\x00" * 24000  # one second
+
+
+def fake_ffmpeg(tmp_path: Path, script: str) -> str:
+    path = tmp_path / "ffmpeg"
+    path.write_text(f"#!/bin/sh\n{script}\n")
+    path.chmod(0o755)
+    return os.fspath(path)
+
+
+def read_wav(path: Path) -> bytes:
+    with wave.open(os.fspath(path), "rb") as wf:
+        assert (wf.getnchannels(), wf.getsampwidth(), wf.getframerate()) == (1, 2, 24000)
+        return wf.readframes(wf.getnframes())
+
+
+@pytest.fixture
+def output(tmp_path: Path) -> Path:
+    out = tmp_path / "out"
+    out.mkdir()
+    return out
+
+
+def test_wav_without_encoder(monkeypatch, output):
+    monkeypatch.setattr(tts_service, "find_mp3_encoder", lambda: None)
+    (output / "chapter-01.mp3").write_bytes(b"stale")
+
+    writer = tts_service._ChapterAudioWriter(output, 1)
+    writer.write(PCM)
+    writer.close()
+
+    assert writer.filename == "chapter-01.wav"
+    assert writer.encoder_error is None
+    assert read_wav(output / "chapter-01.wav") == PCM
+    assert os.listdir(output) == ["chapter-01.wav"]
+
+
+def test_mp3_when_encoder_succeeds(monkeypatch, tmp_path, output):
+    # Stands in for ffmpeg: copies stdin to the output path (its last argument)
+    script = 'for last; do :; done; cat > "$last"'
+    monkeypatch.setattr(tts_service, "find_mp3_encoder", lambda: fake_ffmpeg(tmp_path, script))
+    (output / "chapter-01.wav").write_bytes(b"stale")
+
+    writer = tts_service._ChapterAudioWriter(output, 1)
+    writer.write(PCM)
+    writer.close()
+
+    assert writer.filename == "chapter-01.mp3"
+    assert (output / "chapter-01.mp3").read_bytes() == PCM
+    assert os.listdir(output) == ["chapter-01.mp3"]
+
+
+@pytest.mark.parametrize("script", [
+    # Fails once all input is read
+    'cat > /dev/null; echo "encoder crashed" >&2; exit 1',
+    # Dies mid-stream, so later writes hit a broken pipe
+    'head -c 1000 > /dev/null; echo "encoder crashed" >&2; exit 1',
+])
+def test_failed_encode_keeps_wav(monkeypatch, tmp_path, output, script):
+    monkeypatch.setattr(tts_service, "find_mp3_encoder", lambda: fake_ffmpeg(tmp_path, script))
+
+    writer = tts_service._ChapterAudioWriter(output, 1)
+    for _ in range(8):
+        writer.write(PCM)
+    writer.close()
+
+    assert writer.filename == "chapter-01.wav"
+    assert "encoder crashed" in str(writer.encoder_error)
+    assert read_wav(output / "chapter-01.wav") == PCM * 8
+    assert os.listdir(output) == ["chapter-01.wav"]
+
+
+def test_abort_removes_partial_files(monkeypatch, tmp_path, output):
+    script = 'for last; do :; done; cat > "$last"'
+    monkeypatch.setattr(tts_service, "find_mp3_encoder", lambda: fake_ffmpeg(tmp_path, script))
+
+    writer = tts_service._ChapterAudioWriter(output, 1)
+    writer.write(PCM)
+    writer.abort()
+
+    assert os.listdir(output) == []
@@ -0,0 +1,164 @@
+"""Regression tests for ePub section/chapter extraction."""
+
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from sagevox_converter.epub_parser import parse_epub, parse_epub_sections
+
+BOOKS_DIR = Path(__file__).resolve().parents[2] / "books"
+
+# title, author, cover entry, section count, total words, chapters after front-matter filtering
+SAMPLE_BOOKS = {
+    "emma.epub": (
+        "Emma", "Jane Austen", "OEBPS/7923678841426228017_158-cover.png", 55, 157551, 55,
+    ),
+    "gatsby.epub": (
+        "The Great Gatsby", "F. Scott Fitzgerald", "OEBPS/1631339506626798581_cover.jpg",
+        9, 48146, 9,
+    ),
+    "how-to-invest-money.epub": (
+        "How to Invest Money", "George Garr Henry", "OEBPS/6765394414992002190_icover.jpg",
+        12, 21152, 9,
+    ),
+    "moyens-infaillibles-de-devenir-riche.epub": (
+        "Moyens infaillibles de devenir riche", "Antoine de Nossy",
+        "OEBPS/5875329889697890009_cover.jpg", 8, 15332, 6,
+    ),
+    "sex-education.epub": (
+        "Sex-education / A series of lectures concerning knowledge of sex in its relation to"
+        " human life",
+        "Maurice A. Bigelow", "OEBPS/5916312791223597746_31352-cover.png", 28, 57535, 17,
+    ),
+}
+
+
+def sample_book(name: str) -> Path:
+    path = BOOKS_DIR / name
+    if not path.exists():
+        pytest.skip(f"sample book {name} not available")
+    return path
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLE_BOOKS))
+def test_sample_book_sections(name):
+    title, author, cover, n_sections, total_words, n_chapters = SAMPLE_BOOKS[name]
+
+    parsed = parse_epub_sections(sample_book(name))
+
+    assert (parsed.title, parsed.author, parsed.cover_zip_name) == (title, author, cover)
+    assert [s.index for s in parsed.sections] == list(range(1, n_sections + 1))
+    assert sum(s.word_count for s in parsed.sections) == total_words
+    assert len(parse_epub(sample_book(name), use_cache=False).chapters) == n_chapters
+
+
+def test_gatsby_chapters_split_from_shared_documents():
+    # Gatsby packs several chapters into each document; the ToC anchors split them
+    parsed = parse_epub_sections(sample_book("gatsby.epub"))
+
+    assert [(s.title, s.word_count) for s in parsed.sections] == [
+        ("I", 5896), ("II", 4286), ("III", 5732), ("IV", 5455), ("V", 4230),
+        ("VI", 4034), ("VII", 8776), ("VIII", 4523), ("IX", 5214),
+    ]
+    assert len({s.name for s in parsed.sections}) == 2
+    first = parsed.sections[0]
+    assert first.text_content.startswith("I ")
+    assert not first.text_content_no_headings.startswith("I ")
+
+    chapters = parse_epub(sample_book("gatsby.epub"), use_cache=False).chapters
+    assert [c.number for c in chapters] == list(range(1, 10))
+    assert [c.title for c in chapters] == [s.title for s in parsed.sections]
+
+
+def test_front_matter_is_dropped_from_chapters():
+    chapters = parse_epub(
+        sample_book("moyens-infaillibles-de-devenir-riche.epub"), use_cache=False
+    ).chapters
+
+    assert chapters[0].title == "CHAPITRE PREMIER Le Travail"
+    assert "TABLE" not in [c.title for c in chapters]
+
+
+def _write_epub(path: Path, manifest: str, metadata: str = "", files: dict | None = None) -> Path:
+    """Write a minimal EPUB with no usable ToC, so sections come from the documents."""
+    chapter = "<html><body><h1>{0}</h1><p>{1}</p></body></html>"
+    words = " ".join(["word"] * 20)
+    entries = {
+        "META-INF/container.xml": (
+            '<?xml version="1.0"?>'
+            '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container" version="1.0">'
+            '<rootfiles><rootfile full-path="OEBPS/content.opf"'
+            ' media-type="application/oebps-package+xml"/></rootfiles></container>'
+        ),
+        "OEBPS/content.opf": (
+            '<?xml version="1.0"?>'
+            '<package xmlns="http://www.idpf.org/2007/opf"'
+            ' xmlns:dc="http://purl.org/dc/elements/1.1/" version="3.0">'
+            f"<metadata><dc:title>Tiny</dc:title>{metadata}</metadata>"
+            f"<manifest>{manifest}</manifest><spine/></package>"
+        ),
+        "OEBPS/one.xhtml": chapter.format("One", words),
+        "OEBPS/two.xhtml": chapter.format("Two", words),
+        "OEBPS/nav.xhtml": '<html><body><nav epub:type="toc"><ol></ol></nav></body></html>',
+        **(files or {}),
+    }
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip")
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return path
+
+
+_DOCUMENTS = (
+    '<item id="one" href="one.xhtml" media-type="application/xhtml+xml"/>'
+    '<item id="two" href="two.xhtml" media-type="application/xhtml+xml"/>'
+    '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+)
+
+
+def test_fallback_sections_skip_nav_document(tmp_path):
+    parsed = parse_epub_sections(_write_epub(tmp_path / "tiny.epub", _DOCUMENTS))
+
+    assert [(s.name, s.title) for s in parsed.sections] == [
+        ("one.xhtml", "One"),
+        ("two.xhtml", "Two"),
+    ]
+
+
+def test_epub2_meta_cover_resolves_manifest_id(tmp_path):
+    manifest = _DOCUMENTS + (
+        '<item id="art" href="images/front.png" media-type="image/png"/>'
+        '<item id="other" href="images/cover-back.jpg" media-type="image/jpeg"/>'
+    )
+    path = _write_epub(
+        tmp_path / "tiny.epub", manifest, metadata='<meta name="cover" content="art"/>'
+    )
+
+    parsed = parse_epub_sections(path)
+
+    assert parsed.cover_zip_name == "OEBPS/images/front.png"
+    assert parsed.cover_extension == "png"
+
+
+def test_cover_image_property_wins_over_meta_and_name(tmp_path):
+    manifest = _DOCUMENTS + (
+        '<item id="art" href="images/front.png" media-type="image/png"/>'
+        '<item id="other" href="images/cover-back.jpg" media-type="image/jpeg"/>'
+        '<item id="real" href="images/jacket.jpg" media-type="image/jpeg"'
+        ' properties="cover-image"/>'
+    )
+    path = _write_epub(
+        tmp_path / "tiny.epub", manifest, metadata='<meta name="cover" content="art"/>'
+    )
+
+    assert parse_epub_sections(path).cover_zip_name == "OEBPS/images/jacket.jpg"
+
+
+def test_cover_falls_back_to_image_named_cover(tmp_path):
+    manifest = _DOCUMENTS + '<item id="img" href="images/Cover.jpg" media-type="image/jpeg"/>'
+
+    parsed = parse_epub_sections(_write_epub(tmp_path / "tiny.epub", manifest))
+
+    assert parsed.cover_zip_name == "OEBPS/images/Cover.jpg"
+    assert parsed.cover_extension == "jpg"
@@ -0,0 +1,98 @@
+"""Tests for reusing existing chapter audio when a conversion is resumed."""
+
+import os
+import wave
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from sagevox_converter import cli
+from sagevox_converter.models import Chapter, hash_text
+
+TEXT = "It was a bright cold day in April."
+
+
+def write_wav(path: Path, seconds: float) -> None:
+    with wave.open(os.fspath(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(24000)
+        wf.writeframes(b"\0\0" * int(24000 * seconds))
+
+
+def scan(output: Path) -> dict[str, os.DirEntry]:
+    with os.scandir(output) as entries:
+        return {e.name: e for e in entries if e.is_file()}
+
+
+def make_chapter(**kwargs) -> Chapter:
+    return Chapter(number=3, title="Three", text_content=TEXT, **kwargs)
+
+
+@pytest.fixture
+def output(tmp_path: Path) -> Path:
+    write_wav(tmp_path / "chapter-03.wav", 1.5)
+    (tmp_path / "chapter-03-transcript.json").write_text("{}")
+    return tmp_path
+
+
+def test_finished_chapter_is_reused(output):
+    chapter = make_chapter(content_hash=hash_text(TEXT), audio_file="chapter-03.wav")
+
+    reused = cli._reusable_audio(chapter, output, hash_text(TEXT), True, scan(output))
+
+    assert reused == ("chapter-03.wav", pytest.approx(1.5), "chapter-03-transcript.json")
+
+
+def test_changed_text_is_regenerated(output):
+    chapter = make_chapter(content_hash=hash_text("Older text."), audio_file="chapter-03.wav")
+
+    assert cli._reusable_audio(chapter, output, hash_text(TEXT), True, scan(output)) is None
+    # --no-verify-hash keeps whatever audio is there
+    assert cli._reusable_audio(chapter, output, hash_text(TEXT), False, scan(output)) is not None
+
+
+def test_metadata_without_hash_trusts_recorded_audio(output):
+    recorded = make_chapter(audio_file="chapter-03.wav")
+    unrecorded = make_chapter()
+
+    assert cli._reusable_audio(recorded, output, hash_text(TEXT), True, scan(output)) is not None
+    # Audio never recorded as finished may be from an interrupted run
+    assert cli._reusable_audio(unrecorded, output, hash_text(TEXT), True, scan(output)) is None
+
+
+def test_truncated_or_missing_audio_is_regenerated(tmp_path):
+    chapter = make_chapter(content_hash=hash_text(TEXT), audio_file="chapter-03.wav")
+    assert cli._reusable_audio(chapter, tmp_path, hash_text(TEXT), True, scan(tmp_path)) is None
+
+    (tmp_path / "chapter-03.wav").write_bytes(b"RIFF")
+    assert cli._reusable_audio(chapter, tmp_path, hash_text(TEXT), True, scan(tmp_path)) is None
+
+
+def test_missing_transcript_is_reported(output):
+    (output / "chapter-03-transcript.json").unlink()
+    chapter = make_chapter(content_hash=hash_text(TEXT), audio_file="chapter-03.wav")
+
+    reused = cli._reusable_audio(chapter, output, hash_text(TEXT), True, scan(output))
+
+    assert reused is not None and reused[2] is None
+
+
+class NoSynthesis:
+    def synthesize_chapter(self, *args, **kwargs):
+        raise AssertionError("reused chapter was synthesized")
+
+
+def test_do_chapter_skips_synthesis_on_resume(output):
+    chapter = make_chapter(content_hash=hash_text(TEXT), audio_file="chapter-03.wav")
+    prepared: Future = Future()
+
+    result = cli._do_chapter(
+        chapter, NoSynthesis(), output, None, "classic",
+        True, True, scan(output), prepared,
+    )
+
+    assert result[0] == "chapter-03.wav"
+    assert result[3:] == (hash_text(TEXT), True)
+    assert prepared.cancelled()
@@ -301,44 +301,60 @@ extension LiveAPIClient: RoomDelegate {
                 return
             }
 
-            guard let commandValue = json["command"] as? String, !commandValue.isEmpty else {
-                print("[LiveAPIClient] Missing command in data channel message")
-                return
+            // The agent batches commands from one turn as {"commands": [...]}
+            let messages: [[String: Any]]
+            if let batch = json["commands"] as? [[String: Any]] {
+                messages = batch
+            } else {
+                messages = [json]
             }
 
-            guard let command = AgentCommandType(rawValue: commandValue) else {
-                print("[LiveAPIClient] Unknown command: \(commandValue)")
-                return
-            }
+            let commands = messages.compactMap(parseCommand)
+            guard !commands.isEmpty else { return }
 
-            let commandPayload: AgentCommand
-            switch command {
-            case .resumePlayback:
-                commandPayload = .resumePlayback
-            case .skipBack:
-                let seconds = (json["data"] as? [String: Any])?["seconds"] as? Int
-                    ?? Constants.defaultCommandSeconds
-                commandPayload = .skipBack(seconds: seconds)
-            case .skipForward:
-                let seconds = (json["data"] as? [String: Any])?["seconds"] as? Int
-                    ?? Constants.defaultCommandSeconds
-                commandPayload = .skipForward(seconds: seconds)
-            case .goToChapter:
-                guard let chapter = (json["data"] as? [String: Any])?["chapter"] as? Int else {
-                    print("[LiveAPIClient] Missing chapter in command payload")
-                    return
+            Task { @MainActor in
+                for command in commands {
+                    self.onCommand?(command)
                 }
-                commandPayload = .goToChapter(chapter)
             }
+        } catch {
+            print("[LiveAPIClient] Failed to parse data channel message: \(error)")
+        }
+    }
 
-            print("[LiveAPIClient] Received command: \(command.rawValue)")
+    private func parseCommand(_ json: [String: Any]) -> AgentCommand? {
+        guard let commandValue = json["command"] as? String, !commandValue.isEmpty else {
+            print("[LiveAPIClient] Missing command in data channel message")
+            return nil
+        }
 
-            Task { @MainActor in
-                self.onCommand?(commandPayload)
+        guard let command = AgentCommandType(rawValue: commandValue) else {
+            print("[LiveAPIClient] Unknown command: \(commandValue)")
+            return nil
+        }
+
+        let commandPayload: AgentCommand
+        switch command {
+        case .resumePlayback:
+            commandPayload = .resumePlayback
+        case .skipBack:
+            let seconds = (json["data"] as? [String: Any])?["seconds"] as? Int
+                ?? Constants.defaultCommandSeconds
+            commandPayload = .skipBack(seconds: seconds)
+        case .skipForward:
+            let seconds = (json["data"] as? [String: Any])?["seconds"] as? Int
+                ?? Constants.defaultCommandSeconds
+            commandPayload = .skipForward(seconds: seconds)
+        case .goToChapter:
+            guard let chapter = (json["data"] as? [String: Any])?["chapter"] as? Int else {
+                print("[LiveAPIClient] Missing chapter in command payload")
+                return nil
             }
-        } catch {
-            print("[LiveAPIClient] Failed to parse data channel message: \(error)")
+            commandPayload = .goToChapter(chapter)
         }
+
+        print("[LiveAPIClient] Received command: \(command.rawValue)")
+        return commandPayload
     }
 }
 